@@ -1,3 +1,8 @@
+import argparse
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
 
@@ -48,18 +53,184 @@ def generate_synthetic_data(n_samples=1000, random_seed=42):
 
     return df
 
+def generate_synthetic_chunk(chunk_index, n_rows, random_seed=42):
+    """
+    Generate one independent chunk of the synthetic dataset.
+
+    The chunk draws from its own np.random.Generator seeded with child
+    ``chunk_index`` of SeedSequence(random_seed), so every chunk is
+    reproducible on its own, no matter which process generates it.
+
+    Parameters:
+    - chunk_index: Position of the chunk in the dataset
+    - n_rows: Number of rows in the chunk
+    - random_seed: Seed of the whole dataset
+
+    Returns:
+    - DataFrame with columns: age, income, score
+    """
+    seed_sequence = np.random.SeedSequence(random_seed, spawn_key=(chunk_index,))
+    rng = np.random.default_rng(seed_sequence)
+
+    # Same generative model as generate_synthetic_data
+    age = np.clip(rng.normal(40, 12, n_rows), 18, 65)
+    income = np.clip(30000 + (age - 18) * 1500 + rng.normal(0, 15000, n_rows), 20000, 200000)
+    score = np.clip(50 + (income - 50000) / 3000 + rng.normal(0, 15, n_rows), 0, 100)
+
+    # Introduce NaN values (5% of income, 3% of score within the chunk)
+    income[rng.choice(n_rows, size=int(0.05 * n_rows), replace=False)] = np.nan
+    score[rng.choice(n_rows, size=int(0.03 * n_rows), replace=False)] = np.nan
+
+    # Compact dtypes: ages fit in int8 and 2-decimal scores in float32
+    return pd.DataFrame({
+        'age': np.round(age).astype(np.int8),
+        'income': np.round(income, 2),
+        'score': np.round(score, 2).astype(np.float32)
+    })
+
+
+def _generate_chunk_task(task):
+    return generate_synthetic_chunk(*task)
+
+
+def iter_synthetic_chunks(n_samples, chunk_size=1_000_000, random_seed=42, n_workers=1):
+    """
+    Generate the synthetic dataset chunk by chunk, optionally in parallel.
+
+    Chunk boundaries depend only on chunk_size, so the concatenated output
+    is bit-identical for any number of workers. At most 2 * n_workers chunks
+    are in flight, keeping memory bounded.
+
+    Parameters:
+    - n_samples: Total number of rows
+    - chunk_size: Rows per chunk
+    - random_seed: Seed of the whole dataset
+    - n_workers: Number of worker processes (1 generates in this process)
+
+    Yields:
+    - DataFrame chunks in order
+    """
+    tasks = ((i, min(chunk_size, n_samples - start), random_seed)
+             for i, start in enumerate(range(0, n_samples, chunk_size)))
+
+    if n_workers <= 1:
+        for task in tasks:
+            yield _generate_chunk_task(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = deque()
+        for task in tasks:
+            pending.append(executor.submit(_generate_chunk_task, task))
+            if len(pending) >= 2 * n_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+OUTPUT_FORMATS = ('csv', 'parquet', 'feather', 'npy')
+
+
+def _infer_output_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('', '.npy'):
+        return 'npy'
+    if extension[1:] in OUTPUT_FORMATS:
+        return extension[1:]
+    raise ValueError(f"Cannot infer the output format of {path!r}; "
+                     f"use a .csv, .parquet, .feather or .npy path or pass output_format")
+
+
+def write_synthetic_data(path, n_samples, chunk_size=1_000_000, random_seed=42, n_workers=1,
+                         output_format=None):
+    """
+    Stream the synthetic dataset straight to disk.
+
+    Formats:
+    - 'csv': a single CSV file
+    - 'parquet': a Parquet file with one row group per chunk
+    - 'feather': an uncompressed Arrow IPC (Feather v2) file that can be
+      memory-mapped
+    - 'npy': a directory with one memory-mappable <column>.npy per column
+
+    Parameters:
+    - path: Output file (or directory for 'npy')
+    - n_samples: Total number of rows
+    - chunk_size: Rows per chunk
+    - random_seed: Seed of the whole dataset
+    - n_workers: Number of worker processes
+    - output_format: One of OUTPUT_FORMATS; inferred from the extension if None
+      (.csv, .parquet, .feather, or .npy/no extension for 'npy')
+
+    Returns:
+    - Number of rows written
+    """
+    output_format = output_format or _infer_output_format(path)
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    chunks = iter_synthetic_chunks(n_samples, chunk_size, random_seed, n_workers)
+    n_written = 0
+
+    if output_format == 'csv':
+        with open(path, 'w', newline='') as handle:
+            for chunk in chunks:
+                chunk.to_csv(handle, index=False, header=(n_written == 0))
+                n_written += len(chunk)
+
+    elif output_format == 'npy':
+        os.makedirs(path, exist_ok=True)
+        arrays = {}
+        for chunk in chunks:
+            for col in chunk.columns:
+                if col not in arrays:
+                    arrays[col] = np.lib.format.open_memmap(os.path.join(path, f'{col}.npy'), mode='w+',
+                                                            dtype=chunk[col].dtype, shape=(n_samples,))
+                arrays[col][n_written:n_written + len(chunk)] = chunk[col].to_numpy()
+            n_written += len(chunk)
+        for array in arrays.values():
+            array.flush()
+
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for chunk in chunks:
+                # Build arrays from NumPy directly so NaN stays NaN (not null)
+                table = pa.Table.from_arrays([pa.array(chunk[col].to_numpy()) for col in chunk.columns],
+                                             names=list(chunk.columns))
+                if writer is None:
+                    if output_format == 'parquet':
+                        writer = pq.ParquetWriter(path, table.schema)
+                    else:
+                        writer = pa.ipc.new_file(path, table.schema)
+                writer.write_table(table)
+                n_written += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+    return n_written
+
+
 if __name__ == "__main__":
-    # Generate the dataset
-    data = generate_synthetic_data(1000)
-
-    # Save to CSV
-    data.to_csv('synthetic_data.csv', index=False)
-
-    print("Synthetic dataset generated successfully!")
-    print(f"Dataset shape: {data.shape}")
-    print("\nFirst 10 rows:")
-    print(data.head(10))
-    print("\nDataset info:")
-    print(data.info())
-    print("\nBasic statistics:")
-    print(data.describe())
+    parser = argparse.ArgumentParser(description="Generate the synthetic dataset")
+    parser.add_argument('--rows', type=int, default=1000, help="number of rows")
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help="stream chunks of this many rows to disk (default: one chunk of --rows)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="worker processes for chunked generation")
+    parser.add_argument('--seed', type=int, default=42, help="random seed")
+    parser.add_argument('--output', default='synthetic_data.csv',
+                        help="output file (.csv, .parquet, .feather) or directory for .npy columns")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default=None,
+                        help="output format (inferred from --output by default)")
+    args = parser.parse_args()
+
+    # Without --chunk-size the whole dataset is a single chunk, written in the requested format
+    chunk_size = args.chunk_size or max(args.rows, 1)
+    n_rows = write_synthetic_data(args.output, args.rows, chunk_size,
+                                  args.seed, args.workers, args.format)
+    print(f"Synthetic dataset written to {args.output} ({n_rows} rows)")
@@ -0,0 +1,36 @@
+"""
+Utils Package
+Author: Md Ayan Alam (GF202342645)
+Description: Statistical and visualization utilities shared by the assignments
+"""
+
+import importlib
+
+# Submodules are imported on first attribute access (``Utils.statistical_functions``),
+# so ``import Utils`` stays cheap
+__all__ = [
+    'batch_rendering',
+    'chi_square_tests',
+    'data_io',
+    'figure_export',
+    'parallel_reduction',
+    'plot_summaries',
+    'rank_correlation',
+    'resampling',
+    'sorted_column',
+    'statistical_functions',
+    'stats_cache',
+    'streaming_statistics',
+    'visualization_helpers',
+    'weighted_statistics'
+]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
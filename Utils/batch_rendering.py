@@ -0,0 +1,199 @@
+"""
+Batch Rendering Module
+Author: Md Ayan Alam (GF202342645)
+Description: Headless, pyplot-free rendering of many per-column plots with reused figures and worker processes
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .plot_summaries import DistributionSummary
+from .visualization_helpers import _draw_column, _draw_distribution, _ensure_style
+
+
+# Plot type -> (number of axes, figure size) of the reused figure
+PLOT_LAYOUTS = {
+    'distribution': (2, (15, 6)),
+    'hist': (1, (5, 4)),
+    'box': (1, (5, 4)),
+    'violin': (1, (5, 4))
+}
+
+
+class BatchRenderer:
+    """
+    Render a sequence of plots of one type to files without pyplot.
+
+    One ``Figure`` with an Agg canvas and its axes is created up front and
+    reused for every plot: the axes are cleared, redrawn and the figure is
+    written straight to disk. Nothing is registered with pyplot's figure
+    manager, so memory stays flat over thousands of plots. The layout is
+    computed with ``tight_layout`` on the first plot and kept for the rest.
+
+    Use as a context manager (or call ``close``) to release the figure.
+    """
+
+    def __init__(self, plot_type: str = 'distribution',
+                 figsize: Optional[Tuple[float, float]] = None,
+                 dpi: int = 100,
+                 fmt: str = 'png'):
+        if plot_type not in PLOT_LAYOUTS:
+            raise ValueError(f"Unknown plot type: {plot_type}")
+        n_axes, default_size = PLOT_LAYOUTS[plot_type]
+
+        self.plot_type = plot_type
+        self.dpi = dpi
+        self.fmt = fmt
+        _ensure_style()
+        self.figure = Figure(figsize=figsize or default_size, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.subplots(1, n_axes, squeeze=False)[0]
+        self.n_rendered = 0
+
+    def render(self, data, path: str, title: str = '', **plot_kwargs) -> str:
+        """
+        Draw one plot into the reused figure and save it.
+
+        Parameters:
+        -----------
+        data : array-like, SortedColumn or DistributionSummary
+            Data to plot ('violin' needs the raw data)
+        path : str
+            Output file (the extension is added if missing)
+        title : str
+            Plot title
+        **plot_kwargs
+            'distribution' accepts ``bins`` and ``show_stats``
+
+        Returns:
+        --------
+        str
+            Path of the written file
+        """
+        if self.figure is None:
+            raise RuntimeError("BatchRenderer is closed")
+        if not path.endswith(f'.{self.fmt}'):
+            path = f'{path}.{self.fmt}'
+
+        for ax in self.axes:
+            ax.clear()
+
+        if self.plot_type == 'distribution':
+            _draw_distribution(self.axes[0], self.axes[1], data, title,
+                               plot_kwargs.get('bins', 30), plot_kwargs.get('show_stats', True))
+        else:
+            if not isinstance(data, DistributionSummary):
+                data = pd.Series(data).dropna()
+            _draw_column(self.axes[0], data, self.plot_type, title)
+
+        if self.n_rendered == 0:
+            self.figure.tight_layout()
+        self.figure.savefig(path, dpi=self.dpi, format=self.fmt, facecolor='white')
+        self.n_rendered += 1
+        return path
+
+    def close(self):
+        """Release the figure and its axes."""
+        if self.figure is not None:
+            self.figure.clear()
+            self.figure = None
+            self.axes = None
+
+    def __enter__(self) -> 'BatchRenderer':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# One renderer per worker process, created by the pool initializer
+_worker_renderer: Optional[BatchRenderer] = None
+
+
+def _init_worker(plot_type: str, figsize: Optional[Tuple[float, float]], dpi: int, fmt: str):
+    global _worker_renderer
+    _worker_renderer = BatchRenderer(plot_type, figsize=figsize, dpi=dpi, fmt=fmt)
+
+
+def _render_task(task: Tuple[str, np.ndarray, str, Dict]) -> str:
+    title, values, path, plot_kwargs = task
+    return _worker_renderer.render(values, path, title=title, **plot_kwargs)
+
+
+def render_columns(data: pd.DataFrame,
+                   output_dir: str,
+                   columns: Optional[List[str]] = None,
+                   plot_type: str = 'distribution',
+                   n_workers: int = 1,
+                   figsize: Optional[Tuple[float, float]] = None,
+                   dpi: int = 100,
+                   fmt: str = 'png',
+                   **plot_kwargs) -> List[str]:
+    """
+    Render one plot per column to ``output_dir``, optionally in parallel.
+
+    Each worker process (or the calling process when ``n_workers`` is 1)
+    owns a single ``BatchRenderer`` and reuses its figure for all the
+    columns it is given.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input data
+    output_dir : str
+        Directory for the images (created if needed)
+    columns : list, optional
+        Columns to plot (defaults to the numeric columns)
+    plot_type : str, default='distribution'
+        'distribution', 'hist', 'box' or 'violin'
+    n_workers : int, default=1
+        Number of worker processes
+    figsize : tuple, optional
+        Figure size (defaults depend on the plot type)
+    dpi : int, default=100
+        Resolution of the images
+    fmt : str, default='png'
+        Image format
+    **plot_kwargs
+        Passed to ``BatchRenderer.render``
+
+    Returns:
+    --------
+    list
+        Paths of the written files, in column order
+    """
+    if columns is None:
+        columns = list(data.select_dtypes(include=[np.number]).columns)
+    os.makedirs(output_dir, exist_ok=True)
+
+    tasks = [(str(col), data[col].to_numpy(), os.path.join(output_dir, f'{col}.{fmt}'), plot_kwargs)
+             for col in columns]
+
+    if n_workers <= 1:
+        with BatchRenderer(plot_type, figsize=figsize, dpi=dpi, fmt=fmt) as renderer:
+            return [renderer.render(values, path, title=title, **kwargs)
+                    for title, values, path, kwargs in tasks]
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                             initargs=(plot_type, figsize, dpi, fmt)) as executor:
+        return list(executor.map(_render_task, tasks, chunksize=max(1, len(tasks) // (4 * n_workers))))
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    np.random.seed(42)
+    sample_data = pd.DataFrame(np.random.normal(50, 15, (1000, 8)),
+                               columns=[f'feature_{i}' for i in range(8)])
+
+    print("Testing batch rendering...")
+    with tempfile.TemporaryDirectory() as directory:
+        paths = render_columns(sample_data, directory, n_workers=2)
+        print(f"Rendered {len(paths)} plots")
@@ -0,0 +1,274 @@
+"""
+Chi-Square Tests Module
+Author: Md Ayan Alam (GF202342645)
+Description: Vectorized chi-square goodness-of-fit and independence tests over many tables at once
+"""
+
+import numpy as np
+import pandas as pd
+from typing import List, Optional
+
+
+def chi_square_goodness_of_fit(observed: np.ndarray,
+                               expected: Optional[np.ndarray] = None,
+                               alpha: float = 0.05) -> dict:
+    """
+    Chi-square goodness-of-fit test for one or many frequency vectors.
+
+    Parameters:
+    -----------
+    observed : array-like
+        Observed frequencies, shape (k,) or (n_tests, k)
+    expected : array-like, optional
+        Expected frequencies broadcastable to ``observed`` (equal
+        distribution over the k categories if None)
+    alpha : float, default=0.05
+        Significance level
+
+    Returns:
+    --------
+    dict
+        chi_square, degrees_of_freedom, p_value, critical_value, alpha,
+        reject_null, observed, expected, residuals, standardized_residuals,
+        assumptions_met and min_expected_frequency; scalars for a single
+        vector, arrays of length n_tests for a batch
+    """
+    from scipy.stats import chi2
+
+    observed = np.asarray(observed, dtype=np.float64)
+    k = observed.shape[-1]
+
+    if expected is None:
+        expected = np.broadcast_to(observed.sum(axis=-1, keepdims=True) / k, observed.shape)
+    else:
+        expected = np.broadcast_to(np.asarray(expected, dtype=np.float64), observed.shape)
+
+    residuals = observed - expected
+    with np.errstate(invalid='ignore', divide='ignore'):
+        standardized_residuals = residuals / np.sqrt(expected)
+    chi_square = np.sum(standardized_residuals**2, axis=-1)
+    dof = k - 1
+    min_expected = expected.min(axis=-1)
+    critical_value = chi2.ppf(1 - alpha, dof)
+
+    return {
+        'chi_square': chi_square,
+        'degrees_of_freedom': dof,
+        'p_value': chi2.sf(chi_square, dof),
+        'critical_value': critical_value,
+        'alpha': alpha,
+        'reject_null': chi_square > critical_value,
+        'observed': observed,
+        'expected': expected,
+        'residuals': residuals,
+        'standardized_residuals': standardized_residuals,
+        'assumptions_met': min_expected >= 5,
+        'min_expected_frequency': min_expected
+    }
+
+
+def chi_square_independence(tables: np.ndarray, alpha: float = 0.05) -> dict:
+    """
+    Chi-square test of independence for one table or a stack of tables.
+
+    All tables are tested in one vectorized pass: marginals are summed along
+    the table axes, expected counts come from one broadcast outer product,
+    and p-values from one call to ``chi2.sf``. Empty rows and columns (e.g.
+    padding from ``contingency_tables`` when features have different
+    numbers of levels) are left out of the statistic and the degrees of
+    freedom, so every table is tested on its own shape.
+
+    Parameters:
+    -----------
+    tables : array-like
+        Observed frequencies, shape (r, c) or (n_tables, r, c)
+    alpha : float, default=0.05
+        Significance level
+
+    Returns:
+    --------
+    dict
+        chi_square, degrees_of_freedom, p_value, critical_value, alpha,
+        reject_null, observed, expected, row_totals, col_totals,
+        grand_total, standardized_residuals, cramers_v, assumptions_met and
+        min_expected_frequency; scalars for a single table, arrays with a
+        leading n_tables axis for a stack
+    """
+    from scipy.stats import chi2
+
+    observed = np.asarray(tables, dtype=np.float64)
+    single = observed.ndim == 2
+    if single:
+        observed = observed[np.newaxis]
+    if observed.ndim != 3:
+        raise ValueError("tables must have shape (r, c) or (n_tables, r, c)")
+
+    row_totals = observed.sum(axis=2)
+    col_totals = observed.sum(axis=1)
+    grand_total = row_totals.sum(axis=1)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        expected = row_totals[:, :, np.newaxis] * col_totals[:, np.newaxis, :] / grand_total[:, np.newaxis, np.newaxis]
+        standardized_residuals = (observed - expected) / np.sqrt(expected)
+    # Cells of empty rows/columns have zero expected count and do not contribute
+    standardized_residuals[expected == 0] = 0.0
+    chi_square = np.sum(standardized_residuals**2, axis=(1, 2))
+
+    n_rows = np.count_nonzero(row_totals, axis=1)
+    n_cols = np.count_nonzero(col_totals, axis=1)
+    dof = (n_rows - 1) * (n_cols - 1)
+    testable = dof > 0
+
+    p_value = np.where(testable, chi2.sf(chi_square, np.maximum(dof, 1)), np.nan)
+    critical_value = np.where(testable, chi2.ppf(1 - alpha, np.maximum(dof, 1)), np.nan)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cramers_v = np.sqrt(chi_square / (grand_total * np.minimum(n_rows - 1, n_cols - 1)))
+    min_expected = np.where(expected > 0, expected, np.inf).min(axis=(1, 2))
+
+    results = {
+        'chi_square': chi_square,
+        'degrees_of_freedom': dof,
+        'p_value': p_value,
+        'critical_value': critical_value,
+        'alpha': alpha,
+        'reject_null': chi_square > critical_value,
+        'observed': observed,
+        'expected': expected,
+        'row_totals': row_totals,
+        'col_totals': col_totals,
+        'grand_total': grand_total,
+        'standardized_residuals': standardized_residuals,
+        'cramers_v': np.where(testable, cramers_v, np.nan),
+        'assumptions_met': min_expected >= 5,
+        'min_expected_frequency': min_expected
+    }
+
+    if single:
+        return {key: value[0] if isinstance(value, np.ndarray) else value
+                for key, value in results.items()}
+    return results
+
+
+def contingency_tables(codes: np.ndarray,
+                       target_codes: np.ndarray,
+                       n_levels: Optional[int] = None,
+                       n_target_levels: Optional[int] = None) -> np.ndarray:
+    """
+    Build the contingency table of every feature against a target with one ``np.bincount``.
+
+    Each (feature, level, target level) triple is mapped to one flat index
+    of the output stack, so all tables are counted in a single pass over
+    the data.
+
+    Parameters:
+    -----------
+    codes : array-like of int
+        Integer-coded features, shape (n_samples, n_features); negative
+        codes mark missing values (as in pandas Categorical codes) and are
+        skipped for that feature only
+    target_codes : array-like of int
+        Integer-coded target, shape (n_samples,); negative codes drop the
+        whole sample
+    n_levels : int, optional
+        Number of feature levels (defaults to max(codes) + 1); features with
+        fewer levels are padded with empty rows
+    n_target_levels : int, optional
+        Number of target levels (defaults to max(target_codes) + 1)
+
+    Returns:
+    --------
+    np.ndarray
+        Stack of tables of shape (n_features, n_levels, n_target_levels)
+    """
+    codes = np.asarray(codes)
+    if codes.ndim == 1:
+        codes = codes[:, np.newaxis]
+    target_codes = np.asarray(target_codes)
+    if codes.shape[0] != target_codes.shape[0]:
+        raise ValueError("codes and target_codes must have the same number of samples")
+
+    n_features = codes.shape[1]
+    if n_levels is None:
+        n_levels = int(codes.max()) + 1 if codes.size else 0
+    if n_target_levels is None:
+        n_target_levels = int(target_codes.max()) + 1 if target_codes.size else 0
+
+    table_size = n_levels * n_target_levels
+    combined = (np.arange(n_features, dtype=np.int64) * table_size
+                + codes.astype(np.int64) * n_target_levels
+                + target_codes.astype(np.int64)[:, np.newaxis])
+    valid = (codes >= 0) & (target_codes >= 0)[:, np.newaxis]
+
+    counts = np.bincount(combined[valid], minlength=n_features * table_size)
+    return counts.reshape(n_features, n_levels, n_target_levels)
+
+
+def chi_square_feature_tests(data: pd.DataFrame,
+                             target: str,
+                             columns: Optional[List[str]] = None,
+                             alpha: float = 0.05) -> pd.DataFrame:
+    """
+    Test every categorical feature of a DataFrame for independence from the target.
+
+    Columns are factorized once (missing values get code -1), stacked into
+    an integer code matrix and passed through ``contingency_tables`` and
+    ``chi_square_independence``.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe
+    target : str
+        Target column
+    columns : list, optional
+        Feature columns (defaults to all non-numeric columns except the target)
+    alpha : float, default=0.05
+        Significance level
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per feature with chi_square, dof, p_value, cramers_v,
+        min_expected and reject_null, sorted by p-value
+    """
+    if columns is None:
+        columns = [col for col in data.select_dtypes(exclude=[np.number]).columns if col != target]
+
+    target_codes, _ = pd.factorize(data[target])
+    factorized = [pd.factorize(data[col]) for col in columns]
+    n_levels = max((len(uniques) for _, uniques in factorized), default=0)
+    dtype = np.int32 if n_levels < np.iinfo(np.int32).max else np.int64
+    codes = np.empty((len(data), len(columns)), dtype=dtype)
+    for j, (column_codes, _) in enumerate(factorized):
+        codes[:, j] = column_codes
+
+    tables = contingency_tables(codes, target_codes, n_levels=n_levels)
+    results = chi_square_independence(tables, alpha=alpha)
+
+    return pd.DataFrame({
+        'chi_square': results['chi_square'],
+        'dof': results['degrees_of_freedom'],
+        'p_value': results['p_value'],
+        'cramers_v': results['cramers_v'],
+        'min_expected': results['min_expected_frequency'],
+        'reject_null': results['reject_null']
+    }, index=pd.Index(columns, name='feature')).sort_values('p_value')
+
+
+# Example usage
+if __name__ == "__main__":
+    beverage_data = np.array([
+        [25, 35, 15],  # Male
+        [30, 40, 55]   # Female
+    ])
+    print("Testing chi-square tests...")
+    results = chi_square_independence(beverage_data)
+    print(f"Chi-square: {results['chi_square']:.4f}, p-value: {results['p_value']:.6f}")
+
+    np.random.seed(42)
+    sample_data = pd.DataFrame({
+        'region': np.random.choice(['north', 'south', 'east', 'west'], 5000),
+        'plan': np.random.choice(['basic', 'plus', 'pro'], 5000),
+        'churned': np.random.choice(['yes', 'no'], 5000)
+    })
+    print(chi_square_feature_tests(sample_data, 'churned'))
@@ -0,0 +1,192 @@
+"""
+Data I/O Module
+Author: Md Ayan Alam (GF202342645)
+Description: Column-selective, memory-mapped loaders for CSV, Parquet, Feather and .npy datasets
+"""
+
+import os
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+FEATHER_SUFFIXES = ('.feather', '.arrow', '.ipc')
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+
+def detect_format(path: str) -> str:
+    """
+    Infer the storage format of a dataset path.
+
+    Parameters:
+    -----------
+    path : str
+        File path, or a directory of one ``<column>.npy`` file per column
+
+    Returns:
+    --------
+    str
+        'npy', 'parquet', 'feather' or 'csv'
+    """
+    if os.path.isdir(path) or path.endswith(('.npy', os.sep, '/')):
+        return 'npy'
+    if path.endswith(PARQUET_SUFFIXES):
+        return 'parquet'
+    if path.endswith(FEATHER_SUFFIXES):
+        return 'feather'
+    return 'csv'
+
+
+def _npy_directory(path: str) -> str:
+    return os.path.dirname(path) if path.endswith('.npy') else path
+
+
+def load_column_arrays(path: str,
+                       columns: Optional[List[str]] = None,
+                       mmap: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Load selected columns as NumPy arrays, zero-copy where the format allows.
+
+    - npy directories: each column is a read-only ``np.memmap``; nothing
+      is read until the data is touched.
+    - Feather/Arrow IPC (uncompressed): the file is memory-mapped and each
+      column is a zero-copy view when it was written as a single record
+      batch (otherwise the batches are concatenated once; stream
+      multi-batch files with ``iter_feather_batches`` instead).
+    - Parquet: only the requested column chunks are read and decoded.
+    - CSV: only the requested columns are parsed.
+
+    Parameters:
+    -----------
+    path : str
+        Dataset path (see ``detect_format``)
+    columns : list, optional
+        Columns to load; all columns by default
+    mmap : bool, default=True
+        Memory-map files instead of reading them into memory
+
+    Returns:
+    --------
+    dict
+        Column name -> array
+    """
+    fmt = detect_format(path)
+
+    if fmt == 'npy':
+        directory = _npy_directory(path)
+        if columns is None:
+            columns = sorted(name[:-4] for name in os.listdir(directory) if name.endswith('.npy'))
+        return {col: np.load(os.path.join(directory, f'{col}.npy'), mmap_mode='r' if mmap else None)
+                for col in columns}
+
+    if fmt == 'feather':
+        import pyarrow as pa
+
+        source = pa.memory_map(path, 'r') if mmap else pa.OSFile(path, 'rb')
+        table = pa.ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(columns)
+        arrays = {}
+        for name, column in zip(table.column_names, table.columns):
+            if column.num_chunks == 1 and column.null_count == 0:
+                arrays[name] = column.chunk(0).to_numpy(zero_copy_only=False)
+            else:
+                arrays[name] = column.to_numpy()
+        return arrays
+
+    if fmt == 'parquet':
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, columns=columns, memory_map=mmap)
+        return {name: column.to_numpy() for name, column in zip(table.column_names, table.columns)}
+
+    frame = pd.read_csv(path, usecols=columns)
+    return {col: frame[col].to_numpy() for col in frame.columns}
+
+
+def load_columns(path: str,
+                 columns: Optional[List[str]] = None,
+                 mmap: bool = True) -> pd.DataFrame:
+    """
+    Load selected columns into a DataFrame without copying the arrays.
+
+    The DataFrame wraps the arrays returned by ``load_column_arrays``, so
+    with npy directories and single-batch Feather files its columns stay
+    memory-mapped. Pass it to ``binning_analysis(..., engine='numpy')`` or a
+    column to ``comprehensive_summary_stats`` to work on files larger than
+    memory.
+
+    Parameters:
+    -----------
+    path : str
+        Dataset path (see ``detect_format``)
+    columns : list, optional
+        Columns to load; all columns by default
+    mmap : bool, default=True
+        Memory-map files instead of reading them into memory
+
+    Returns:
+    --------
+    pd.DataFrame
+        DataFrame with the requested columns
+    """
+    return pd.DataFrame(load_column_arrays(path, columns=columns, mmap=mmap), copy=False)
+
+
+def iter_feather_batches(path: str,
+                         columns: Optional[List[str]] = None,
+                         chunksize: int = 100_000,
+                         mmap: bool = True) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a Feather/Arrow IPC file one record batch at a time.
+
+    Every record batch is sliced into chunks of at most ``chunksize`` rows,
+    and each chunk is a DataFrame of zero-copy views of the memory-mapped
+    batch (columns with nulls or non-numeric types are converted). Files
+    written in many batches, like the chunked output of ``generate_data.py``,
+    are therefore never concatenated.
+
+    Parameters:
+    -----------
+    path : str
+        Feather/Arrow IPC file
+    columns : list, optional
+        Columns to read; all columns by default
+    chunksize : int, default=100_000
+        Maximum rows per chunk
+    mmap : bool, default=True
+        Memory-map the file instead of reading it
+
+    Yields:
+    -------
+    pd.DataFrame
+        Consecutive chunks of rows
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(path, 'r') if mmap else pa.OSFile(path, 'rb')
+    reader = pa.ipc.open_file(source)
+    for i in range(reader.num_record_batches):
+        batch = reader.get_batch(i)
+        if columns is not None:
+            batch = batch.select(columns)
+        for start in range(0, batch.num_rows, chunksize):
+            piece = batch.slice(start, chunksize)
+            yield pd.DataFrame({name: column.to_numpy(zero_copy_only=False)
+                                for name, column in zip(piece.schema.names, piece.columns)}, copy=False)
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    np.random.seed(42)
+    with tempfile.TemporaryDirectory() as directory:
+        np.save(os.path.join(directory, 'age.npy'), np.random.randint(18, 65, 1000).astype(np.int8))
+        np.save(os.path.join(directory, 'score.npy'), np.random.uniform(0, 100, 1000).astype(np.float32))
+
+        data = load_columns(directory, ['age', 'score'])
+        print("Testing memory-mapped loading...")
+        print(data.dtypes)
+        print(data.describe())
@@ -0,0 +1,356 @@
+"""
+Figure Export Module
+Author: Md Ayan Alam (GF202342645)
+Description: Render-once multi-format figure export and a content-addressed on-disk figure cache
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    import matplotlib.figure
+
+
+# Raster format -> Pillow format name; all of them are encoded from one Agg render
+RASTER_FORMATS = {
+    'png': 'PNG',
+    'jpg': 'JPEG',
+    'jpeg': 'JPEG',
+    'tif': 'TIFF',
+    'tiff': 'TIFF',
+    'webp': 'WEBP'
+}
+
+
+def _tight_bbox(fig: 'matplotlib.figure.Figure', dpi: int, pad_inches: float):
+    """Tight bounding box as ``savefig(bbox_inches='tight')`` computes it at ``dpi``."""
+    if not hasattr(fig.canvas, 'get_renderer'):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        FigureCanvasAgg(fig)
+    original_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        return fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+    finally:
+        fig.dpi = original_dpi
+
+
+def export_figure(fig: 'matplotlib.figure.Figure',
+                  filename: str,
+                  formats: Sequence[str] = ('png', 'pdf'),
+                  dpi: int = 300,
+                  n_threads: Optional[int] = None,
+                  pad_inches: float = 0.1) -> List[str]:
+    """
+    Write a figure in several formats, computing the layout and the raster only once.
+
+    The tight bounding box is computed once and passed to every
+    ``savefig`` call as a fixed box. All raster formats are encoded from a
+    single Agg render (PNG bytes, converted with Pillow for the others).
+    Vector formats are drawn one after another, because a figure cannot be
+    drawn by two threads at once, while the raster encoding and writing run
+    in a thread pool alongside them.
+
+    Parameters:
+    -----------
+    fig : matplotlib.figure.Figure
+        Figure to save
+    filename : str
+        Base filename (without extension)
+    formats : sequence of str, default=('png', 'pdf')
+        File formats to write
+    dpi : int, default=300
+        Resolution for raster formats
+    n_threads : int, optional
+        Threads for encoding and writing (defaults to one per format; 1
+        writes everything in the calling thread)
+    pad_inches : float, default=0.1
+        Padding around the tight bounding box
+
+    Returns:
+    --------
+    list
+        Paths of the written files, in the order of ``formats``
+    """
+    bbox = _tight_bbox(fig, dpi, pad_inches)
+    save_kwargs = {'dpi': dpi, 'bbox_inches': bbox, 'facecolor': 'white', 'edgecolor': 'none'}
+    paths = [f"{filename}.{fmt}" for fmt in formats]
+
+    jobs = []
+    raster = [(fmt, path) for fmt, path in zip(formats, paths) if fmt.lower() in RASTER_FORMATS]
+    if raster:
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', **save_kwargs)
+        png_bytes = buffer.getvalue()
+
+        def write_raster(fmt: str, path: str):
+            pillow_format = RASTER_FORMATS[fmt.lower()]
+            if pillow_format == 'PNG':
+                with open(path, 'wb') as file:
+                    file.write(png_bytes)
+                return
+            from PIL import Image
+
+            with Image.open(BytesIO(png_bytes)) as image:
+                # The figure is drawn on an opaque white background, so dropping alpha is lossless
+                image.convert('RGB').save(path, format=pillow_format, dpi=(dpi, dpi))
+
+        jobs = [(write_raster, fmt, path) for fmt, path in raster]
+
+    vector = [(fmt, path) for fmt, path in zip(formats, paths) if fmt.lower() not in RASTER_FORMATS]
+    if n_threads == 1 or not jobs:
+        for job, fmt, path in jobs:
+            job(fmt, path)
+        for fmt, path in vector:
+            fig.savefig(path, format=fmt, **save_kwargs)
+    else:
+        with ThreadPoolExecutor(max_workers=n_threads or len(jobs)) as executor:
+            futures = [executor.submit(job, fmt, path) for job, fmt, path in jobs]
+            for fmt, path in vector:
+                fig.savefig(path, format=fmt, **save_kwargs)
+            for future in futures:
+                future.result()
+
+    return paths
+
+
+def figure_key(data: Any, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Content hash of the input data and plot parameters of a figure.
+
+    Parameters:
+    -----------
+    data : DataFrame, Series, array, list/tuple of these, or any object with a stable repr
+        Data the figure is drawn from
+    params : dict, optional
+        Plot parameters (title, bins, ...); values are hashed through their
+        JSON or repr form
+
+    Returns:
+    --------
+    str
+        32-character hexadecimal key
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    items = data if isinstance(data, (list, tuple)) else [data]
+    for item in items:
+        if isinstance(item, (pd.DataFrame, pd.Series)):
+            digest.update(pd.util.hash_pandas_object(item, index=True).to_numpy().tobytes())
+            labels = list(item.columns) if isinstance(item, pd.DataFrame) else [item.name]
+            digest.update(repr(labels).encode())
+        elif isinstance(item, np.ndarray):
+            array = pd.util.hash_array(item.ravel()) if item.dtype == object else np.ascontiguousarray(item)
+            digest.update(f"{item.dtype.str}{item.shape}".encode())
+            digest.update(array.view(np.uint8).ravel().data)
+        else:
+            digest.update(repr(item).encode())
+    digest.update(json.dumps(params or {}, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """
+    On-disk cache of exported figures keyed by ``figure_key``.
+
+    Every artifact is stored as ``<directory>/<key[:2]>/<key>.<format>``
+    and written atomically, so concurrent report jobs can share a cache.
+    When the files exceed ``max_bytes`` the least recently used ones (by
+    modification time, refreshed on every hit) are deleted.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str, fmt: str) -> str:
+        """Location of the artifact of ``key`` in format ``fmt``."""
+        return os.path.join(self.directory, key[:2], f"{key}.{fmt}")
+
+    def lookup(self, key: str, formats: Sequence[str]) -> Optional[List[str]]:
+        """
+        Cached artifacts of ``key`` in all ``formats``, or None if any is missing.
+
+        Parameters:
+        -----------
+        key : str
+            Figure key
+        formats : sequence of str
+            Required formats
+
+        Returns:
+        --------
+        list or None
+            Paths of the cached files
+        """
+        paths = [self.path(key, fmt) for fmt in formats]
+        if not all(os.path.exists(path) for path in paths):
+            self.misses += 1
+            return None
+        for path in paths:
+            os.utime(path)
+        self.hits += 1
+        return paths
+
+    def store(self, key: str, files: Dict[str, str]):
+        """
+        Copy exported files into the cache and evict down to ``max_bytes``.
+
+        Parameters:
+        -----------
+        key : str
+            Figure key
+        files : dict
+            Format -> path of the exported file
+        """
+        for fmt, source in files.items():
+            target = self.path(key, fmt)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            temporary = f"{target}.{os.getpid()}.tmp"
+            shutil.copyfile(source, temporary)
+            os.replace(temporary, target)
+        self.evict()
+
+    def _files(self) -> List[os.DirEntry]:
+        entries = []
+        for prefix in os.scandir(self.directory):
+            if prefix.is_dir():
+                entries.extend(entry for entry in os.scandir(prefix.path)
+                               if entry.is_file() and not entry.name.endswith('.tmp'))
+        return entries
+
+    def evict(self):
+        """Delete least recently used files until the cache fits in ``max_bytes``."""
+        files = sorted(((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in self._files()))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Delete all cached files and reset the counters."""
+        for entry in self._files():
+            os.remove(entry.path)
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self) -> dict:
+        """
+        Cache statistics.
+
+        Returns:
+        --------
+        dict
+            hits, misses, hit_rate, evictions, entries, current_bytes, max_bytes
+        """
+        files = self._files()
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else np.nan,
+            'evictions': self.evictions,
+            'entries': len(files),
+            'current_bytes': sum(entry.stat().st_size for entry in files),
+            'max_bytes': self.max_bytes
+        }
+
+
+def export_cached(make_figure: Callable[[], 'matplotlib.figure.Figure'],
+                  filename: str,
+                  data: Any,
+                  params: Optional[Dict[str, Any]] = None,
+                  cache: Optional[FigureCache] = None,
+                  formats: Sequence[str] = ('png', 'pdf'),
+                  dpi: int = 300,
+                  n_threads: Optional[int] = None) -> List[str]:
+    """
+    Export a figure unless an identical one is already cached.
+
+    The key combines the data, ``params``, ``dpi`` and the matplotlib
+    version. On a hit the cached files are copied to ``filename`` and
+    ``make_figure`` is never called; on a miss the figure is built,
+    exported with ``export_figure``, stored in the cache and closed.
+
+    Parameters:
+    -----------
+    make_figure : callable
+        Zero-argument function creating the figure
+    filename : str
+        Base filename (without extension)
+    data : object
+        Input data of the figure (see ``figure_key``)
+    params : dict, optional
+        Plot parameters that affect the figure
+    cache : FigureCache, optional
+        Cache to use (the figure is always rendered without one)
+    formats : sequence of str, default=('png', 'pdf')
+        File formats to write
+    dpi : int, default=300
+        Resolution for raster formats
+    n_threads : int, optional
+        Threads for ``export_figure``
+
+    Returns:
+    --------
+    list
+        Paths of the written files, in the order of ``formats``
+    """
+    import matplotlib
+
+    key = None
+    if cache is not None:
+        key = figure_key(data, {'params': params, 'dpi': dpi, 'matplotlib': matplotlib.__version__})
+        cached = cache.lookup(key, formats)
+        if cached is not None:
+            paths = [f"{filename}.{fmt}" for fmt in formats]
+            for source, target in zip(cached, paths):
+                shutil.copyfile(source, target)
+            return paths
+
+    fig = make_figure()
+    try:
+        paths = export_figure(fig, filename, formats=formats, dpi=dpi, n_threads=n_threads)
+    finally:
+        if 'matplotlib.pyplot' in sys.modules:
+            sys.modules['matplotlib.pyplot'].close(fig)
+
+    if cache is not None:
+        cache.store(key, dict(zip(formats, paths)))
+    return paths
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    from .visualization_helpers import create_distribution_plot
+
+    np.random.seed(42)
+    values = pd.Series(np.random.normal(50, 15, 100_000), name='values')
+
+    print("Testing figure export...")
+    with tempfile.TemporaryDirectory() as directory:
+        cache = FigureCache(os.path.join(directory, 'cache'))
+        for _ in range(2):
+            export_cached(lambda: create_distribution_plot(values, title='Values'),
+                          os.path.join(directory, 'values'), data=values,
+                          params={'title': 'Values'}, cache=cache, formats=['png', 'jpg', 'pdf'])
+        print(cache.info())
@@ -0,0 +1,116 @@
+"""
+Import Benchmark Module
+Author: Md Ayan Alam (GF202342645)
+Description: Measures the import time of every Utils module and checks that heavy dependencies stay lazy
+
+Run from the repository root:
+    python -m Utils.import_benchmark [--repeat 5] [--max-seconds 1.5]
+The exit status is 1 when a module loads a dependency it should defer or
+exceeds the time budget, so it can guard against regressions in CI.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+
+# Dependencies that take a second or more to import and must only be
+# loaded on first use
+HEAVY_MODULES = ['scipy.stats', 'matplotlib.pyplot', 'seaborn', 'plotly.express', 'plotly.graph_objects']
+
+# Module -> heavy dependencies it is allowed to import eagerly
+ALLOWED_HEAVY = {
+    'batch_rendering': [],
+    'chi_square_tests': [],
+    'data_io': [],
+    'figure_export': [],
+    'parallel_reduction': [],
+    'plot_summaries': [],
+    'rank_correlation': [],
+    'resampling': [],
+    'sorted_column': [],
+    'statistical_functions': [],
+    'stats_cache': [],
+    'streaming_statistics': [],
+    'visualization_helpers': [],
+    'weighted_statistics': []
+}
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed)
+print(','.join(name for name in {heavy!r} if name in sys.modules))
+"""
+
+
+def measure_import(module: str, repeat: int = 5) -> Dict[str, object]:
+    """
+    Import ``module`` in fresh interpreters and report the fastest time.
+
+    Parameters:
+    -----------
+    module : str
+        Dotted module name, e.g. 'Utils.statistical_functions'
+    repeat : int, default=5
+        Number of fresh interpreters (the minimum time is reported)
+
+    Returns:
+    --------
+    dict
+        module, seconds and heavy (heavy dependencies that were loaded)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    times, heavy = [], []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                                cwd=root, capture_output=True, text=True, check=True).stdout.splitlines()
+        times.append(float(output[0]))
+        heavy = [name for name in output[1].split(',') if name] if len(output) > 1 else []
+    return {'module': module, 'seconds': min(times), 'heavy': heavy}
+
+
+def run_benchmark(repeat: int = 5, max_seconds: float = 1.5) -> List[Dict[str, object]]:
+    """
+    Benchmark every Utils module and flag regressions.
+
+    Parameters:
+    -----------
+    repeat : int, default=5
+        Fresh interpreters per module
+    max_seconds : float, default=1.5
+        Import time budget per module
+
+    Returns:
+    --------
+    list
+        One result per module (see ``measure_import``) with an added
+        'problems' list
+    """
+    results = []
+    for name, allowed in ALLOWED_HEAVY.items():
+        result = measure_import(f'Utils.{name}', repeat=repeat)
+        problems = [f'eagerly imports {dep}' for dep in result['heavy'] if dep not in allowed]
+        if result['seconds'] > max_seconds:
+            problems.append(f"exceeds {max_seconds:.2f}s budget")
+        result['problems'] = problems
+        results.append(result)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure import times of the Utils modules")
+    parser.add_argument('--repeat', type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument('--max-seconds', type=float, default=1.5, help="import time budget per module")
+    args = parser.parse_args()
+
+    results = run_benchmark(repeat=args.repeat, max_seconds=args.max_seconds)
+    for result in results:
+        status = 'OK' if not result['problems'] else '; '.join(result['problems'])
+        print(f"{result['module']:<35} {result['seconds']:7.3f}s  {status}")
+
+    sys.exit(1 if any(result['problems'] for result in results) else 0)
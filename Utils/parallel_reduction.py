@@ -0,0 +1,243 @@
+"""
+Parallel Reduction Module
+Author: Md Ayan Alam (GF202342645)
+Description: Process-pool driver that reduces data shards to mergeable accumulators
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, reduce
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .streaming_statistics import (BinnedStatsAccumulator, StreamingSummaryStats,
+                                   WeightedMeanAccumulator, iter_chunks)
+
+
+Shard = Union[str, pd.DataFrame]
+
+
+def split_frame(data: pd.DataFrame, n_shards: int) -> List[pd.DataFrame]:
+    """
+    Split a DataFrame into contiguous row shards of nearly equal size.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe
+    n_shards : int
+        Number of shards
+
+    Returns:
+    --------
+    list
+        List of DataFrame slices
+    """
+    boundaries = np.linspace(0, len(data), max(1, n_shards) + 1).astype(int)
+    return [data.iloc[start:stop] for start, stop in zip(boundaries[:-1], boundaries[1:])
+            if stop > start]
+
+
+def parallel_reduce(shards: Sequence[Any],
+                    reduce_shard: Callable[[Any], Any],
+                    n_workers: Optional[int] = None) -> Any:
+    """
+    Reduce every shard in a worker process and merge the partial results.
+
+    Parameters:
+    -----------
+    shards : sequence
+        Shards to process (DataFrames, file paths, ...); must be picklable
+    reduce_shard : callable
+        Top-level (picklable) function mapping one shard to an accumulator
+        with a ``merge`` method
+    n_workers : int, optional
+        Number of worker processes; defaults to ``os.cpu_count()``. With a
+        single worker the shards are reduced in the calling process.
+
+    Returns:
+    --------
+    object
+        The merged accumulator
+    """
+    if len(shards) == 0:
+        raise ValueError("No shards to reduce")
+
+    n_workers = min(n_workers or os.cpu_count() or 1, len(shards))
+    if n_workers == 1:
+        partials = map(reduce_shard, shards)
+        return reduce(lambda left, right: left.merge(right), partials)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        partials = executor.map(reduce_shard, shards)
+        return reduce(lambda left, right: left.merge(right), partials)
+
+
+def _as_shards(source: Union[pd.DataFrame, Sequence[str]], n_workers: Optional[int]) -> List[Shard]:
+    """Turn a DataFrame or a list of files into a list of shards."""
+    if isinstance(source, pd.DataFrame):
+        return split_frame(source, n_workers or os.cpu_count() or 1)
+    return list(source)
+
+
+def _seeded_shards(shards: List[Shard], seed: Optional[int]) -> List[Tuple[Shard, Optional[int]]]:
+    """Pair every shard with its own sketch seed from ``SeedSequence(seed).spawn``."""
+    if seed is None:
+        return [(shard, None) for shard in shards]
+    children = np.random.SeedSequence(seed).spawn(len(shards))
+    return [(shard, int(child.generate_state(1)[0])) for shard, child in zip(shards, children)]
+
+
+def _summary_shard(task: Tuple[Shard, Optional[int]], column: str, chunksize: int,
+                   k: int) -> StreamingSummaryStats:
+    shard, seed = task
+    accumulator = StreamingSummaryStats(column=column, k=k, seed=seed)
+    for chunk in iter_chunks(shard, columns=[column], chunksize=chunksize):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def _weighted_mean_shard(shard: Shard, value_column: str, weight_column: str,
+                         chunksize: int) -> WeightedMeanAccumulator:
+    accumulator = WeightedMeanAccumulator()
+    for chunk in iter_chunks(shard, columns=[value_column, weight_column], chunksize=chunksize):
+        accumulator.update(chunk[value_column], chunk[weight_column])
+    return accumulator
+
+
+def _binning_shard(task: Tuple[Shard, Optional[int]], bin_column: str, target_columns: List[str],
+                   bins: List, labels: Optional[List], chunksize: int, k: int) -> BinnedStatsAccumulator:
+    shard, seed = task
+    accumulator = BinnedStatsAccumulator(bin_column, target_columns, bins, labels=labels, k=k, seed=seed)
+    columns = [bin_column] + [col for col in target_columns if col != bin_column]
+    for chunk in iter_chunks(shard, columns=columns, chunksize=chunksize):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def parallel_summary_stats(source: Union[pd.DataFrame, Sequence[str]],
+                           column: str,
+                           n_workers: Optional[int] = None,
+                           chunksize: int = 1_000_000,
+                           k: int = 200,
+                           seed: Optional[int] = None) -> dict:
+    """
+    Calculate comprehensive summary statistics of one column in parallel.
+
+    Parameters:
+    -----------
+    source : pd.DataFrame or list of str
+        DataFrame (split into one shard per worker) or list of CSV/Parquet files
+    column : str
+        Column to summarise
+    n_workers : int, optional
+        Number of worker processes
+    chunksize : int, default=1_000_000
+        Rows per chunk within a shard
+    k : int, default=200
+        Size parameter of the quantile sketch
+    seed : int, optional
+        Seed of the quantile sketches; each shard gets its own stream, so
+        the approximate quantiles are reproducible for a given sharding
+
+    Returns:
+    --------
+    dict
+        Same keys as ``comprehensive_summary_stats``
+    """
+    reducer = partial(_summary_shard, column=column, chunksize=chunksize, k=k)
+    shards = _seeded_shards(_as_shards(source, n_workers), seed)
+    return parallel_reduce(shards, reducer, n_workers).result()
+
+
+def parallel_weighted_mean(source: Union[pd.DataFrame, Sequence[str]],
+                           value_column: str,
+                           weight_column: str,
+                           n_workers: Optional[int] = None,
+                           chunksize: int = 1_000_000) -> float:
+    """
+    Calculate a weighted mean in parallel.
+
+    Parameters:
+    -----------
+    source : pd.DataFrame or list of str
+        DataFrame (split into one shard per worker) or list of CSV/Parquet files
+    value_column : str
+        Column with the values
+    weight_column : str
+        Column with the weights
+    n_workers : int, optional
+        Number of worker processes
+    chunksize : int, default=1_000_000
+        Rows per chunk within a shard
+
+    Returns:
+    --------
+    float
+        Weighted mean of the values
+    """
+    reducer = partial(_weighted_mean_shard, value_column=value_column,
+                      weight_column=weight_column, chunksize=chunksize)
+    return parallel_reduce(_as_shards(source, n_workers), reducer, n_workers).result()
+
+
+def parallel_binning_analysis(source: Union[pd.DataFrame, Sequence[str]],
+                              bin_column: str,
+                              target_columns: List[str],
+                              bins: List,
+                              labels: Optional[List] = None,
+                              n_workers: Optional[int] = None,
+                              chunksize: int = 1_000_000,
+                              k: int = 200,
+                              seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Perform binning analysis in parallel.
+
+    Parameters:
+    -----------
+    source : pd.DataFrame or list of str
+        DataFrame (split into one shard per worker) or list of CSV/Parquet files
+    bin_column : str
+        Column name to create bins for
+    target_columns : list
+        Columns to calculate statistics for each bin
+    bins : list
+        Bin edges (left-closed, as in ``binning_analysis``)
+    labels : list, optional
+        Labels for the bins
+    n_workers : int, optional
+        Number of worker processes
+    chunksize : int, default=1_000_000
+        Rows per chunk within a shard
+    k : int, default=200
+        Size parameter of the per-bin median sketches
+    seed : int, optional
+        Seed of the median sketches; each shard gets its own stream
+
+    Returns:
+    --------
+    pd.DataFrame
+        Binned analysis results; medians are approximate
+    """
+    reducer = partial(_binning_shard, bin_column=bin_column, target_columns=list(target_columns),
+                      bins=list(bins), labels=labels, chunksize=chunksize, k=k)
+    shards = _seeded_shards(_as_shards(source, n_workers), seed)
+    return parallel_reduce(shards, reducer, n_workers).result()
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    sample_data = pd.DataFrame({
+        'values': np.random.normal(50, 15, 200_000),
+        'weights': np.random.uniform(1, 5, 200_000),
+        'age': np.random.randint(18, 65, 200_000)
+    })
+
+    print("Testing parallel reduction...")
+    print(f"Weighted mean: {parallel_weighted_mean(sample_data, 'values', 'weights', n_workers=4)}")
+    summary = parallel_summary_stats(sample_data, 'values', n_workers=4)
+    print(f"Summary statistics: {summary}")
+    print(parallel_binning_analysis(sample_data, 'age', ['values'], [18, 30, 45, 65], n_workers=4))
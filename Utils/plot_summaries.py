@@ -0,0 +1,446 @@
+"""
+Plot Summaries Module
+Author: Md Ayan Alam (GF202342645)
+Description: Chunked pre-aggregation of histograms, box plot statistics and correlation tiles, and density-preserving downsampling of point clouds, so huge data plots from compact inputs
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .streaming_statistics import StreamingSummaryStats, iter_chunks
+
+
+class DistributionSummary:
+    """
+    Everything ``create_distribution_plot`` and ``create_subplots_grid``
+    need to draw a histogram and a box plot, without the raw values.
+
+    Holds the histogram counts and edges, the box plot statistics in the
+    format of ``matplotlib.axes.Axes.bxp`` (with at most ``max_fliers``
+    sampled outliers) and the mean, median and standard deviation. Build
+    one with ``summarize_distribution`` or directly from precomputed values.
+    """
+
+    __slots__ = ('counts', 'edges', 'q1', 'median', 'q3', 'whislo', 'whishi', 'fliers',
+                 'n_fliers', 'mean', 'std', 'count', 'name')
+
+    def __init__(self, counts: np.ndarray, edges: np.ndarray, q1: float, median: float, q3: float,
+                 whislo: float, whishi: float, fliers: Optional[np.ndarray] = None,
+                 n_fliers: Optional[int] = None, mean: float = np.nan, std: float = np.nan,
+                 name=None):
+        self.counts = np.asarray(counts)
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.size != self.counts.size + 1:
+            raise ValueError("edges must have one more element than counts")
+        self.q1, self.median, self.q3 = q1, median, q3
+        self.whislo, self.whishi = whislo, whishi
+        self.fliers = np.empty(0) if fliers is None else np.asarray(fliers, dtype=np.float64)
+        self.n_fliers = self.fliers.size if n_fliers is None else n_fliers
+        self.mean, self.std = mean, std
+        self.count = int(self.counts.sum())
+        self.name = name
+
+    def __repr__(self) -> str:
+        return (f"DistributionSummary(name={self.name!r}, count={self.count}, bins={self.counts.size}, "
+                f"fliers={self.fliers.size}/{self.n_fliers})")
+
+    def density(self) -> np.ndarray:
+        """Histogram counts normalised to a probability density."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.counts / (self.count * np.diff(self.edges))
+
+    def boxplot_stats(self) -> dict:
+        """
+        Box plot statistics in the format of ``matplotlib.axes.Axes.bxp``.
+
+        Returns:
+        --------
+        dict
+            med, q1, q3, whislo, whishi and fliers
+        """
+        return {
+            'med': self.median,
+            'q1': self.q1,
+            'q3': self.q3,
+            'whislo': self.whislo,
+            'whishi': self.whishi,
+            'fliers': self.fliers
+        }
+
+
+def _iter_values(source, column: Optional[str], chunksize: int) -> Iterator[np.ndarray]:
+    """NaN-free float64 chunks of an array, Series, DataFrame column or file column."""
+    if isinstance(source, (np.ndarray, pd.Series)):
+        chunks = (source[start:start + chunksize] for start in range(0, len(source), chunksize))
+    else:
+        if column is None:
+            raise ValueError("column must be given for DataFrames and files")
+        chunks = (chunk[column] for chunk in iter_chunks(source, columns=[column], chunksize=chunksize))
+
+    for chunk in chunks:
+        if isinstance(chunk, pd.Series):
+            values = chunk.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = np.asarray(chunk, dtype=np.float64)
+        yield values[~np.isnan(values)]
+
+
+def summarize_distribution(source: Union[np.ndarray, pd.Series, pd.DataFrame, str],
+                           column: Optional[str] = None,
+                           bins: int = 30,
+                           whis: float = 1.5,
+                           max_fliers: int = 1000,
+                           chunksize: int = 10_000_000,
+                           exact_quantiles: Optional[bool] = None,
+                           k: int = 200,
+                           seed: Optional[int] = None) -> DistributionSummary:
+    """
+    Pre-aggregate a column into histogram counts and box plot statistics in two chunked passes.
+
+    The first pass accumulates the range, moments and quartiles
+    (``StreamingSummaryStats``); the second bins every chunk with
+    ``np.histogram`` over uniform edges, finds the whiskers and keeps a
+    uniform random sample of at most ``max_fliers`` outliers. Memory is
+    O(chunksize + bins + max_fliers) and the result plots in O(bins).
+
+    Parameters:
+    -----------
+    source : array-like, pd.DataFrame or str
+        Column values (arrays and memmaps are sliced, not copied), or a
+        DataFrame or CSV/Parquet/Feather/npy path together with ``column``
+    column : str, optional
+        Column to summarise for DataFrames and files
+    bins : int, default=30
+        Number of histogram bins
+    whis : float, default=1.5
+        Whisker length as a multiple of the IQR
+    max_fliers : int, default=1000
+        Maximum number of outliers kept for drawing
+    chunksize : int, default=10_000_000
+        Values per chunk
+    exact_quantiles : bool, optional
+        Compute exact quartiles with ``np.nanquantile``, which copies the
+        whole column into memory; defaults to True only for in-memory arrays
+        and Series of at most ``chunksize`` values (never for memmaps),
+        otherwise the quartiles come from the streaming sketch
+    k : int, default=200
+        Size parameter of the quantile sketch
+    seed : int, optional
+        Seed for the sketch and the outlier sample
+
+    Returns:
+    --------
+    DistributionSummary
+        Summary that can be passed to the plotting functions
+    """
+    in_memory = isinstance(source, (np.ndarray, pd.Series))
+    if exact_quantiles is None:
+        exact_quantiles = in_memory and not isinstance(source, np.memmap) and len(source) <= chunksize
+    if exact_quantiles and not in_memory:
+        raise ValueError("exact_quantiles requires an in-memory array or Series")
+    name = source.name if isinstance(source, pd.Series) else column
+
+    accumulator = StreamingSummaryStats(k=k, seed=seed)
+    for values in _iter_values(source, column, chunksize):
+        accumulator.update(values)
+    summary = accumulator.result()
+    if 'error' in summary:
+        raise ValueError("No valid data points to summarise")
+
+    if exact_quantiles:
+        values = source.to_numpy(dtype=np.float64, na_value=np.nan) if isinstance(source, pd.Series) else source
+        q1, median, q3 = np.nanquantile(values, [0.25, 0.5, 0.75])
+    else:
+        q1, median, q3 = summary['q1'], summary['median'], summary['q3']
+
+    lower_fence = q1 - whis * (q3 - q1)
+    upper_fence = q3 + whis * (q3 - q1)
+    value_range = (summary['min'], summary['max'])
+    if value_range[0] == value_range[1]:
+        # Same widening as np.histogram for constant data
+        value_range = (value_range[0] - 0.5, value_range[1] + 0.5)
+
+    counts = np.zeros(bins, dtype=np.int64)
+    whislo, whishi = np.inf, -np.inf
+    rng = np.random.default_rng(seed)
+    fliers, priorities = np.empty(0), np.empty(0)
+    n_fliers = 0
+
+    for values in _iter_values(source, column, chunksize):
+        counts += np.histogram(values, bins=bins, range=value_range)[0]
+
+        inside = (values >= lower_fence) & (values <= upper_fence)
+        if inside.any():
+            whislo = min(whislo, values[inside].min())
+            whishi = max(whishi, values[inside].max())
+
+        # Keep the outliers with the smallest random priorities: a uniform sample
+        outliers = values[~inside]
+        n_fliers += outliers.size
+        if outliers.size:
+            fliers = np.concatenate([fliers, outliers])
+            priorities = np.concatenate([priorities, rng.random(outliers.size)])
+            if fliers.size > max_fliers:
+                keep = np.argpartition(priorities, max_fliers)[:max_fliers]
+                fliers, priorities = fliers[keep], priorities[keep]
+
+    if not np.isfinite(whislo):
+        whislo, whishi = q1, q3
+
+    return DistributionSummary(counts, np.linspace(value_range[0], value_range[1], bins + 1),
+                               q1=q1, median=median, q3=q3, whislo=whislo, whishi=whishi,
+                               fliers=np.sort(fliers), n_fliers=n_fliers,
+                               mean=summary['mean'], std=summary['std'], name=name)
+
+
+def grid_downsample(x: Union[np.ndarray, pd.Series],
+                    y: Union[np.ndarray, pd.Series],
+                    max_points: int,
+                    grid_size: int = 256,
+                    strata: Optional[np.ndarray] = None,
+                    seed: Optional[int] = None) -> np.ndarray:
+    """
+    Density-preserving sample of at most ``max_points`` rows of a 2-D point cloud.
+
+    The x/y range is cut into a ``grid_size`` x ``grid_size`` grid (per
+    stratum when ``strata`` is given) and every occupied cell keeps random
+    representatives in proportion to its count, but at least one, so dense
+    regions keep their shape and sparse regions and outliers stay visible.
+    The proportion is the largest one that fits the budget; if there are
+    more occupied cells than ``max_points``, a random subset of cells keeps
+    one point each.
+
+    Parameters:
+    -----------
+    x, y : array-like
+        Point coordinates; rows where either is NaN are never selected
+    max_points : int
+        Maximum number of rows to keep
+    grid_size : int, default=256
+        Number of grid cells along each axis
+    strata : array-like of int, optional
+        Integer group codes (e.g. from ``pd.factorize``) sampled separately
+    seed : int, optional
+        Seed for the choice of representatives
+
+    Returns:
+    --------
+    np.ndarray
+        Sorted positional indices of the kept rows
+    """
+    x = pd.Series(x).to_numpy(dtype=np.float64, na_value=np.nan)
+    y = pd.Series(y).to_numpy(dtype=np.float64, na_value=np.nan)
+    index = np.flatnonzero(~(np.isnan(x) | np.isnan(y)))
+    if index.size <= max_points:
+        return index
+
+    def cells(values: np.ndarray) -> np.ndarray:
+        low, high = values.min(), values.max()
+        if high == low:
+            return np.zeros(values.size, dtype=np.int64)
+        return np.minimum(((values - low) * (grid_size / (high - low))).astype(np.int64), grid_size - 1)
+
+    codes = cells(x[index]) * grid_size + cells(y[index])
+    if strata is not None:
+        codes += (np.asarray(strata)[index].astype(np.int64) + 1) * grid_size**2
+
+    # Random order within each cell, so the first ``quota`` rows of a cell are a random sample
+    rng = np.random.default_rng(seed)
+    order = np.lexsort((rng.random(codes.size), codes))
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.concatenate([[True], sorted_codes[1:] != sorted_codes[:-1]]))
+    counts = np.diff(np.append(starts, codes.size))
+
+    if counts.size >= max_points:
+        quota = np.zeros(counts.size, dtype=np.int64)
+        quota[rng.choice(counts.size, max_points, replace=False)] = 1
+    else:
+        # Largest sampling rate whose per-cell quotas (at least one) fit the budget
+        low, high = 0.0, max_points / codes.size
+        for _ in range(50):
+            rate = (low + high) / 2
+            if np.maximum(1, np.floor(counts * rate)).sum() <= max_points:
+                low = rate
+            else:
+                high = rate
+        quota = np.maximum(1, np.floor(counts * low)).astype(np.int64)
+
+    rank = np.arange(codes.size) - np.repeat(starts, counts)
+    return np.sort(index[order[rank < np.repeat(quota, counts)]])
+
+
+def _is_pair_table(corr) -> bool:
+    """True for the long pair tables of ``top_correlated_pairs``."""
+    return isinstance(corr, pd.DataFrame) and {'column_a', 'column_b', 'correlation'} <= set(corr.columns)
+
+
+def correlation_tiles(corr: Union[pd.DataFrame, Iterable],
+                      columns: Optional[List[str]] = None,
+                      n_tiles: int = 512,
+                      boundaries: Optional[np.ndarray] = None,
+                      aggregate: str = 'mean') -> pd.DataFrame:
+    """
+    Aggregate a correlation matrix into at most ``n_tiles`` x ``n_tiles`` tiles for drawing.
+
+    Accepts a dense matrix, the pair table of ``top_correlated_pairs`` or
+    the (correlation_block, n_obs_block) stream of ``correlation_blocks``;
+    pairs and blocks are binned straight into the tile grid, so the full
+    p x p matrix is never built. Missing pairs leave their tiles empty (NaN).
+
+    Parameters:
+    -----------
+    corr : pd.DataFrame or iterable
+        Dense correlation matrix, pair table (column_a, column_b,
+        correlation) or iterable of correlation blocks
+    columns : list, optional
+        All columns in display order (e.g. from ``cluster_order``); required
+        for blocks, otherwise defaults to the matrix columns or the order
+        of first appearance in the pair table
+    n_tiles : int, default=512
+        Maximum number of tiles per side (consecutive columns share a tile)
+    boundaries : array-like of int, optional
+        Explicit tile boundaries as positions in ``columns`` (0, ..., p),
+        e.g. cluster boundaries; overrides ``n_tiles``
+    aggregate : str, default='mean'
+        'mean' of the correlations in a tile, or 'max_abs' for the one with
+        the largest magnitude (keeps strong sparse pairs visible)
+
+    Returns:
+    --------
+    pd.DataFrame
+        Tile matrix labelled with the column (or 'first..last' column range)
+        of every tile
+    """
+    if aggregate not in ('mean', 'max_abs'):
+        raise ValueError(f"Unknown aggregate: {aggregate}")
+    pairs = _is_pair_table(corr)
+
+    if columns is None:
+        if pairs:
+            columns = pd.unique(np.concatenate([corr['column_a'].to_numpy(), corr['column_b'].to_numpy()]))
+        elif isinstance(corr, pd.DataFrame):
+            columns = corr.columns
+        else:
+            raise ValueError("columns must be given for correlation blocks")
+    columns = pd.Index(columns)
+    n_columns = len(columns)
+
+    if boundaries is None:
+        count = min(n_tiles, n_columns)
+        boundaries = np.arange(count + 1) * n_columns // count
+    boundaries = np.asarray(boundaries, dtype=np.int64)
+    count = boundaries.size - 1
+    tile_of_position = np.repeat(np.arange(count), np.diff(boundaries))
+    size = count * count
+
+    def tiles_of(names) -> np.ndarray:
+        positions = columns.get_indexer(names)
+        if (positions < 0).any():
+            raise ValueError("correlations refer to columns that are not in columns")
+        return tile_of_position[positions]
+
+    if aggregate == 'mean':
+        sums, counts = np.zeros(size), np.zeros(size)
+    else:
+        high, low = np.full(size, -np.inf), np.full(size, np.inf)
+
+    def add(flat: np.ndarray, values: np.ndarray):
+        valid = ~np.isnan(values)
+        flat, values = flat[valid], values[valid]
+        if aggregate == 'mean':
+            sums[:] += np.bincount(flat, weights=values, minlength=size)
+            counts[:] += np.bincount(flat, minlength=size)
+        else:
+            np.fmax.at(high, flat, values)
+            np.fmin.at(low, flat, values)
+
+    def add_block(rows: np.ndarray, cols: np.ndarray, values: np.ndarray):
+        # Row strips of ~4M cells keep the flat tile indices small
+        strip = max(1, 4_000_000 // max(cols.size, 1))
+        for start in range(0, rows.size, strip):
+            flat = (rows[start:start + strip, np.newaxis] * count + cols).ravel()
+            add(flat, values[start:start + strip].ravel())
+
+    if pairs:
+        first, second = tiles_of(corr['column_a']), tiles_of(corr['column_b'])
+        values = corr['correlation'].to_numpy(dtype=np.float64)
+        add(first * count + second, values)
+        add(second * count + first, values)
+    elif isinstance(corr, pd.DataFrame):
+        add_block(tiles_of(corr.index), tiles_of(corr.columns), corr.to_numpy(dtype=np.float64))
+    else:
+        for block in corr:
+            if isinstance(block, tuple):
+                block = block[0]
+            rows, cols = tiles_of(block.index), tiles_of(block.columns)
+            values = block.to_numpy(dtype=np.float64)
+            add_block(rows, cols, values)
+            # Off-diagonal blocks stand for their mirror image as well
+            if not block.index.equals(block.columns):
+                add_block(cols, rows, values.T)
+
+    if aggregate == 'mean':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            tiles = np.where(counts > 0, sums / counts, np.nan)
+    else:
+        tiles = np.where(np.abs(high) >= np.abs(low), high, low)
+        tiles[np.isinf(high)] = np.nan
+
+    labels = [str(columns[start]) if stop - start == 1 else f'{columns[start]}..{columns[stop - 1]}'
+              for start, stop in zip(boundaries[:-1], boundaries[1:])]
+    return pd.DataFrame(tiles.reshape(count, count), index=labels, columns=labels)
+
+
+def cluster_order(corr_matrix: pd.DataFrame,
+                  n_clusters: Optional[int] = None,
+                  method: str = 'average') -> Tuple[pd.Index, Optional[np.ndarray]]:
+    """
+    Order the columns of a correlation matrix by hierarchical clustering.
+
+    Columns are clustered on the distance 1 - r and ordered by the leaves
+    of the dendrogram, which places correlated columns next to each other.
+
+    Parameters:
+    -----------
+    corr_matrix : pd.DataFrame
+        Dense correlation matrix (NaNs are treated as 0)
+    n_clusters : int, optional
+        Cut the tree into this many clusters and return their boundaries
+    method : str, default='average'
+        Linkage method of ``scipy.cluster.hierarchy.linkage``
+
+    Returns:
+    --------
+    tuple
+        (ordered_columns, boundaries) where boundaries are the cluster
+        boundaries as positions in the ordered columns (None without
+        ``n_clusters``), suitable for ``correlation_tiles``
+    """
+    from scipy.cluster import hierarchy
+    from scipy.spatial.distance import squareform
+
+    distances = 1 - np.nan_to_num(corr_matrix.to_numpy(dtype=np.float64))
+    np.fill_diagonal(distances, 0.0)
+    linkage = hierarchy.linkage(squareform(np.clip(distances, 0, 2), checks=False), method=method)
+    leaves = hierarchy.leaves_list(linkage)
+
+    boundaries = None
+    if n_clusters is not None:
+        labels = hierarchy.fcluster(linkage, n_clusters, criterion='maxclust')[leaves]
+        changes = np.flatnonzero(labels[1:] != labels[:-1]) + 1
+        boundaries = np.concatenate([[0], changes, [labels.size]])
+
+    return corr_matrix.columns[leaves], boundaries
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    values = np.random.lognormal(3, 0.6, 5_000_000)
+    values[::1000] = np.nan
+
+    summary = summarize_distribution(values, bins=50, chunksize=1_000_000, seed=0)
+    print("Testing distribution summaries...")
+    print(summary)
+    print(summary.boxplot_stats()['whishi'], summary.n_fliers)
@@ -0,0 +1,255 @@
+"""
+Rank Correlation Module
+Author: Md Ayan Alam (GF202342645)
+Description: Spearman and Kendall correlation matrices that rank every column only once
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .statistical_functions import _masked_correlation, correlation_p_values
+
+
+def rank_columns(values: np.ndarray) -> np.ndarray:
+    """
+    Average ranks of every column, computed once (NaNs stay NaN).
+
+    Parameters:
+    -----------
+    values : np.ndarray
+        2-D array of shape (n_rows, n_columns)
+
+    Returns:
+    --------
+    np.ndarray
+        Ranks starting at 1, ties sharing their average rank
+    """
+    from scipy import stats
+
+    return stats.rankdata(values, axis=0, nan_policy='omit')
+
+
+def spearman_correlation(data: pd.DataFrame,
+                         dtype: type = np.float64) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Spearman correlation matrix from one ranking per column and one masked matrix product.
+
+    Each column is ranked once over its own non-missing values; the
+    Pearson correlations of the ranks then come from the masked products
+    of ``pairwise_correlation``. Without missing values this equals
+    ``DataFrame.corr(method='spearman')``; with missing values the ranks
+    are not recomputed on each pair's complete rows (as pandas does), which
+    is what makes the cost O(n * p^2) instead of O(p^2 * n log n).
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe (non-numeric columns are ignored)
+    dtype : numpy dtype, default=np.float64
+        Floating point type used for the matrix products
+
+    Returns:
+    --------
+    tuple
+        (correlation_matrix, n_obs_matrix)
+    """
+    numeric_data = data.select_dtypes(include=[np.number])
+    columns = numeric_data.columns
+    ranks = rank_columns(numeric_data.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    mask = ~np.isnan(ranks)
+    weights = mask.astype(dtype)
+    col_means = np.nansum(ranks, axis=0) / np.maximum(mask.sum(axis=0), 1)
+    centered = np.where(mask, ranks - col_means, 0.0).astype(dtype, copy=False)
+
+    corr, n_obs, var_i = _masked_correlation(centered, weights, centered, weights)
+    np.fill_diagonal(corr, np.where(np.diag(var_i) > 0, 1.0, np.nan))
+
+    return (pd.DataFrame(corr, index=columns, columns=columns),
+            pd.DataFrame(n_obs.astype(np.int64), index=columns, columns=columns))
+
+
+def _dense_ranks(values: np.ndarray) -> np.ndarray:
+    """Dense integer ranks of a column (0, 1, 2, ...); -1 for NaN."""
+    valid = ~np.isnan(values)
+    ranks = np.full(values.size, -1, dtype=np.int64)
+    ranks[valid] = np.unique(values[valid], return_inverse=True)[1]
+    return ranks
+
+
+def _count_inversions(values: np.ndarray) -> int:
+    """
+    Number of pairs i < j with values[i] > values[j], by a vectorized bottom-up merge sort.
+
+    At every level, sorted runs of width w are merged pairwise with one
+    stable sort of (run pair, value) keys; since the input consists of
+    presorted runs this is a linear-time merge. A right-run element placed
+    at offset m of its merged run, being the r-th of its own run, has
+    m - r left-run elements at or below it, so the remaining left-run
+    elements are inversions.
+    """
+    n = values.size
+    values = values.astype(np.int64, copy=True)
+    span = int(values.max()) + 1 if n else 1
+    positions = np.arange(n)
+    inversions = 0
+    width = 1
+    while width < n:
+        block = positions // (2 * width)
+        offset = positions - block * 2 * width
+        order = np.argsort(block * span + values, kind='stable')
+
+        source_offset = offset[order]
+        is_right = source_offset >= width
+        left_length = np.minimum(width, n - block * 2 * width)
+        # Sorting keeps every element inside its block, so offset[g] is its merged offset
+        below_or_equal = offset[is_right] - (source_offset[is_right] - width)
+        inversions += int(np.sum(left_length[is_right] - below_or_equal))
+
+        values = values[order]
+        width *= 2
+    return inversions
+
+
+def _tie_pairs(ranks: np.ndarray) -> int:
+    """Number of tied pairs, sum of t * (t - 1) / 2 over groups of equal ranks."""
+    counts = np.bincount(ranks)
+    return int(np.sum(counts * (counts - 1) // 2))
+
+
+def kendall_tau_b(x_ranks: np.ndarray, y_ranks: np.ndarray) -> Tuple[float, int]:
+    """
+    Kendall's tau-b of two dense-ranked columns in O(n log n).
+
+    Rows are sorted by (x, y) and the discordant pairs are the inversions
+    of the y sequence; the tie counts of x, y and (x, y) give tau-b as in
+    ``scipy.stats.kendalltau``. Rows where either rank is -1 (missing) are
+    dropped.
+
+    Parameters:
+    -----------
+    x_ranks, y_ranks : np.ndarray
+        Dense integer ranks (see ``_dense_ranks``)
+
+    Returns:
+    --------
+    tuple
+        (tau_b, n_obs)
+    """
+    valid = (x_ranks >= 0) & (y_ranks >= 0)
+    if not valid.all():
+        x_ranks, y_ranks = x_ranks[valid], y_ranks[valid]
+    n = x_ranks.size
+    if n < 2:
+        return np.nan, n
+
+    order = np.lexsort((y_ranks, x_ranks))
+    x_sorted, y_sorted = x_ranks[order], y_ranks[order]
+
+    joint_start = np.concatenate([[True], (x_sorted[1:] != x_sorted[:-1]) | (y_sorted[1:] != y_sorted[:-1])])
+    joint_counts = np.diff(np.append(np.flatnonzero(joint_start), n))
+    joint_ties = int(np.sum(joint_counts * (joint_counts - 1) // 2))
+
+    total = n * (n - 1) // 2
+    x_ties, y_ties = _tie_pairs(x_sorted), _tie_pairs(y_sorted)
+    discordant = _count_inversions(y_sorted)
+
+    denominator = np.sqrt(float(total - x_ties) * float(total - y_ties))
+    if denominator == 0:
+        return np.nan, n
+    return (total - x_ties - y_ties + joint_ties - 2 * discordant) / denominator, n
+
+
+def kendall_correlation(data: pd.DataFrame,
+                        n_workers: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Kendall tau-b correlation matrix in O(p^2 * n log n).
+
+    Every column is converted to dense integer ranks once; each pair is
+    then handled by ``kendall_tau_b`` on its pairwise-complete rows. Pairs
+    are distributed over a thread pool (the sorts release the GIL).
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe (non-numeric columns are ignored)
+    n_workers : int, optional
+        Number of threads (defaults to ``os.cpu_count()``)
+
+    Returns:
+    --------
+    tuple
+        (correlation_matrix, n_obs_matrix)
+    """
+    numeric_data = data.select_dtypes(include=[np.number])
+    columns = numeric_data.columns
+    values = numeric_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    ranks = [_dense_ranks(values[:, j]) for j in range(values.shape[1])]
+
+    n_cols = len(columns)
+    rows, cols = np.triu_indices(n_cols, k=1)
+
+    def pair_task(pair):
+        return kendall_tau_b(ranks[pair[0]], ranks[pair[1]])
+
+    with ThreadPoolExecutor(max_workers=n_workers or os.cpu_count() or 1) as executor:
+        results = list(executor.map(pair_task, zip(rows, cols)))
+
+    corr = np.zeros((n_cols, n_cols))
+    n_obs = np.diag([(rank >= 0).sum() for rank in ranks]).astype(np.int64)
+    for (i, j), (tau, n) in zip(zip(rows, cols), results):
+        corr[i, j] = corr[j, i] = tau
+        n_obs[i, j] = n_obs[j, i] = n
+    np.fill_diagonal(corr, 1.0)
+
+    return (pd.DataFrame(corr, index=columns, columns=columns),
+            pd.DataFrame(n_obs, index=columns, columns=columns))
+
+
+def rank_correlation_analysis(data: pd.DataFrame,
+                              method: str = 'spearman',
+                              n_workers: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Rank correlation matrix and p-values, as returned by ``correlation_analysis``.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe
+    method : str, default='spearman'
+        'spearman' or 'kendall'
+    n_workers : int, optional
+        Number of threads for Kendall's tau
+
+    Returns:
+    --------
+    tuple
+        (correlation_matrix, p_values_matrix)
+    """
+    if method == 'spearman':
+        corr, n_obs = spearman_correlation(data)
+    elif method == 'kendall':
+        corr, n_obs = kendall_correlation(data, n_workers=n_workers)
+    else:
+        raise ValueError(f"Unknown rank correlation method: {method}")
+
+    p_values = correlation_p_values(corr.to_numpy(), n_obs.to_numpy(), method=method)
+    return corr, pd.DataFrame(p_values, index=corr.index, columns=corr.columns)
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    sample_data = pd.DataFrame({
+        'age': np.random.randint(18, 65, 100_000),
+        'income': np.random.lognormal(11, 0.5, 100_000),
+    })
+    sample_data['score'] = sample_data['age'] + np.random.normal(0, 10, 100_000)
+
+    print("Testing rank correlation...")
+    corr, p_values = rank_correlation_analysis(sample_data, method='kendall')
+    print(corr)
@@ -0,0 +1,332 @@
+"""
+Sorted Column Module
+Author: Md Ayan Alam (GF202342645)
+Description: Sort-once column representation answering order-statistic queries in O(1)/O(log n)
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, Optional, Union
+
+
+class SortedColumn:
+    """
+    A column sorted once, answering quantile, median, mode, min/max, IQR
+    bound and rank queries without re-selecting over the data.
+
+    Only the sorted non-NaN values (in their original dtype, so float32 or
+    int8 columns stay compact) and the number of missing values are stored;
+    the original row positions are kept only when requested, so thousands
+    of columns fit in memory. Quantiles, min/max and IQR bounds are O(1),
+    rank queries O(log n); the mode and the moments are computed on first
+    use from the sorted values and then remembered.
+
+    ``comprehensive_summary_stats``, ``detect_outliers_iqr`` (built with
+    ``keep_positions=True``) and ``create_distribution_plot`` accept a
+    SortedColumn in place of the data.
+    """
+
+    __slots__ = ('values', 'missing', 'name', 'positions', 'index', '_mode', '_moments')
+
+    def __init__(self, values: np.ndarray, missing: int = 0, name=None,
+                 positions: Optional[np.ndarray] = None, index: Optional[pd.Index] = None):
+        self.values = values
+        self.missing = missing
+        self.name = name
+        self.positions = positions
+        self.index = index
+        self._mode = None
+        self._moments = None
+
+    @classmethod
+    def from_data(cls, data: Union[np.ndarray, pd.Series], keep_positions: bool = False) -> 'SortedColumn':
+        """
+        Sort a column once.
+
+        Parameters:
+        -----------
+        data : array-like
+            Column to sort (NaNs are dropped and counted)
+        keep_positions : bool, default=False
+            Also store the original position of every sorted value and the
+            Series index (needed to map outlier masks back to the original
+            rows)
+
+        Returns:
+        --------
+        SortedColumn
+            Sorted representation of the column
+        """
+        name = data.name if isinstance(data, pd.Series) else None
+        if isinstance(data, pd.Series):
+            if isinstance(data.dtype, np.dtype) and data.dtype.kind in 'iuf':
+                values = data.to_numpy()
+            else:
+                values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = np.asarray(data)
+            if values.dtype.kind not in 'iuf':
+                values = values.astype(np.float64)
+
+        n_total = values.size
+        if values.dtype.kind == 'f':
+            valid = ~np.isnan(values)
+            if not valid.all():
+                kept = np.flatnonzero(valid)
+                values = values[kept]
+            else:
+                kept = None
+        else:
+            kept = None
+
+        if keep_positions:
+            order = np.argsort(values, kind='stable')
+            sorted_values = values[order]
+            index_dtype = np.int32 if n_total < np.iinfo(np.int32).max else np.int64
+            positions = (order if kept is None else kept[order]).astype(index_dtype)
+        else:
+            sorted_values = np.sort(values)
+            positions = None
+
+        index = data.index if keep_positions and isinstance(data, pd.Series) else None
+        return cls(sorted_values, missing=n_total - sorted_values.size, name=name,
+                   positions=positions, index=index)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, keep_positions: bool = False) -> Dict[str, 'SortedColumn']:
+        """
+        Sort every numeric column of a DataFrame once.
+
+        Parameters:
+        -----------
+        data : pd.DataFrame
+            Input dataframe
+        keep_positions : bool, default=False
+            Also store original row positions
+
+        Returns:
+        --------
+        dict
+            Column name -> SortedColumn
+        """
+        numeric_data = data.select_dtypes(include=[np.number])
+        return {col: cls.from_data(numeric_data[col], keep_positions=keep_positions)
+                for col in numeric_data.columns}
+
+    def __len__(self) -> int:
+        return self.values.size
+
+    def __repr__(self) -> str:
+        return (f"SortedColumn(name={self.name!r}, count={self.count}, missing={self.missing}, "
+                f"dtype={self.values.dtype})")
+
+    @property
+    def count(self) -> int:
+        """Number of non-missing values."""
+        return self.values.size
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the stored arrays."""
+        return self.values.nbytes + (self.positions.nbytes if self.positions is not None else 0)
+
+    @property
+    def min(self) -> float:
+        return self.values[0] if self.count else np.nan
+
+    @property
+    def max(self) -> float:
+        return self.values[-1] if self.count else np.nan
+
+    def quantile(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Quantiles with linear interpolation (same as pandas), O(1) each.
+
+        Parameters:
+        -----------
+        q : float or array-like
+            Quantile(s) in [0, 1]
+
+        Returns:
+        --------
+        float or np.ndarray
+            Quantile value(s)
+        """
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        position = np.asarray(q, dtype=float) * (self.count - 1)
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, self.count - 1)
+        fraction = position - lower
+        low_values = self.values[lower].astype(np.float64)
+        result = low_values + fraction * (self.values[upper] - low_values)
+        return result if np.ndim(q) else float(result)
+
+    def median(self) -> float:
+        """Median of the column."""
+        return self.quantile(0.5)
+
+    def mode(self) -> float:
+        """Most frequent value from the run lengths of the sorted values (smallest on ties)."""
+        if self._mode is None:
+            if self.count == 0:
+                self._mode = np.nan
+            else:
+                values = self.values
+                run_starts = np.flatnonzero(np.concatenate([[True], values[1:] != values[:-1]]))
+                run_lengths = np.diff(np.append(run_starts, values.size))
+                self._mode = values[run_starts[np.argmax(run_lengths)]]
+        return self._mode
+
+    def iqr_bounds(self, multiplier: float = 1.5) -> dict:
+        """
+        Quartiles and Tukey fences.
+
+        Parameters:
+        -----------
+        multiplier : float, default=1.5
+            IQR multiplier for the fences
+
+        Returns:
+        --------
+        dict
+            Q1, Q3, IQR, lower_bound, upper_bound
+        """
+        q1, q3 = self.quantile([0.25, 0.75])
+        iqr = q3 - q1
+        return {
+            'Q1': q1,
+            'Q3': q3,
+            'IQR': iqr,
+            'lower_bound': q1 - multiplier * iqr,
+            'upper_bound': q3 + multiplier * iqr
+        }
+
+    def rank(self, value: Union[float, np.ndarray], side: str = 'right') -> Union[int, np.ndarray]:
+        """
+        Number of values below (side='left') or at most (side='right') ``value``, O(log n).
+
+        Parameters:
+        -----------
+        value : float or array-like
+            Query value(s)
+        side : str, default='right'
+            'left' counts values < value, 'right' counts values <= value
+
+        Returns:
+        --------
+        int or np.ndarray
+            Rank(s) of the query value(s)
+        """
+        return np.searchsorted(self.values, value, side=side)
+
+    def count_between(self, lower: float, upper: float) -> int:
+        """Number of values in the closed interval [lower, upper], O(log n)."""
+        return int(self.rank(upper, side='right') - self.rank(lower, side='left'))
+
+    def moments(self) -> dict:
+        """
+        Count, mean, variance, standard deviation, skewness and kurtosis.
+
+        Returns:
+        --------
+        dict
+            count, mean, var, std (ddof=1), skewness and kurtosis (biased,
+            as in scipy.stats)
+        """
+        if self._moments is None:
+            count = self.count
+            if count == 0:
+                self._moments = {'count': 0, 'mean': np.nan, 'var': np.nan, 'std': np.nan,
+                                 'skewness': np.nan, 'kurtosis': np.nan}
+            else:
+                values = self.values.astype(np.float64, copy=False)
+                mean = values.mean()
+                deviations = values - mean
+                squares = deviations * deviations
+                m2 = squares.sum()
+                var = m2 / (count - 1) if count > 1 else np.nan
+                if m2 > 0:
+                    skewness = np.sqrt(count) * (squares * deviations).sum() / m2**1.5
+                    kurtosis = count * (squares * squares).sum() / m2**2 - 3.0
+                else:
+                    skewness = kurtosis = np.nan
+                self._moments = {'count': count, 'mean': mean, 'var': var, 'std': np.sqrt(var),
+                                 'skewness': skewness, 'kurtosis': kurtosis}
+        return self._moments
+
+    def summary(self) -> dict:
+        """
+        Summary statistics with the same keys as ``comprehensive_summary_stats``.
+
+        Returns:
+        --------
+        dict
+            Dictionary containing various statistical measures
+        """
+        if self.count == 0:
+            return {'error': 'No valid data points'}
+
+        moments = self.moments()
+        q1, median, q3 = self.quantile([0.25, 0.5, 0.75])
+        mean, std = moments['mean'], moments['std']
+        min_val, max_val = self.min, self.max
+
+        return {
+            'count': self.count,
+            'missing': self.missing,
+            'mean': mean,
+            'median': median,
+            'mode': self.mode(),
+            'std': std,
+            'var': moments['var'],
+            'min': min_val,
+            'max': max_val,
+            'range': max_val - min_val,
+            'q1': q1,
+            'q3': q3,
+            'iqr': q3 - q1,
+            'skewness': moments['skewness'],
+            'kurtosis': moments['kurtosis'],
+            'cv': std / mean if mean != 0 else np.nan
+        }
+
+    def boxplot_stats(self, whis: float = 1.5) -> dict:
+        """
+        Box plot statistics in the format of ``matplotlib.axes.Axes.bxp``.
+
+        Parameters:
+        -----------
+        whis : float, default=1.5
+            Whisker length as a multiple of the IQR
+
+        Returns:
+        --------
+        dict
+            med, q1, q3, whislo, whishi and fliers
+        """
+        bounds = self.iqr_bounds(whis)
+        low = self.rank(bounds['lower_bound'], side='left')
+        high = self.rank(bounds['upper_bound'], side='right')
+        inside = self.values[low:high]
+        return {
+            'med': self.median(),
+            'q1': bounds['Q1'],
+            'q3': bounds['Q3'],
+            'whislo': inside[0] if inside.size else bounds['Q1'],
+            'whishi': inside[-1] if inside.size else bounds['Q3'],
+            'fliers': np.concatenate([self.values[:low], self.values[high:]])
+        }
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    data = pd.Series(np.random.normal(50, 15, 10_000), name='values')
+    data[::100] = np.nan
+
+    column = SortedColumn.from_data(data)
+    print("Testing SortedColumn...")
+    print(column)
+    print(f"Median: {column.median():.3f}, IQR bounds: {column.iqr_bounds()}")
+    print(f"Values <= 50: {column.rank(50)}")
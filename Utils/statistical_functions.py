@@ -4,12 +4,24 @@ Author: Md Ayan Alam (GF202342645)
 Description: Custom statistical methods and utility functions for data analysis
 """
 
+import bisect
+import os
+import sys
 import numpy as np
 import pandas as pd
-from scipy import stats
-from typing import Union, List, Tuple, Optional
+from typing import Iterator, Union, List, Tuple, Optional
 import warnings
 
+if __package__ in (None, ''):
+    # Run as a script (python Utils/statistical_functions.py): resolve the relative
+    # imports below against the Utils package
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'Utils'
+
+from .sorted_column import SortedColumn
+from .stats_cache import cached_quantiles, cached_sorted_column, get_cache
+from .weighted_statistics import weighted_mean as _weighted_mean
+
 
 def weighted_mean(values: Union[np.ndarray, pd.Series],
                   weights: Union[np.ndarray, pd.Series]) -> float:
@@ -28,21 +40,8 @@ def weighted_mean(values: Union[np.ndarray, pd.Series],
     float
         Weighted mean of the values
     """
-    # Convert to pandas Series for easier NaN handling
-    if not isinstance(values, pd.Series):
-        values = pd.Series(values)
-    if not isinstance(weights, pd.Series):
-        weights = pd.Series(weights)
-
-    # Remove NaN values
-    valid_mask = values.notna() & weights.notna()
-    clean_values = values[valid_mask]
-    clean_weights = weights[valid_mask]
-
-    if len(clean_values) == 0:
-        return np.nan
-
-    return (clean_values * clean_weights).sum() / clean_weights.sum()
+    # Works directly on NumPy arrays; see weighted_statistics for the full suite
+    return _weighted_mean(values, weights)
 
 
 def detect_outliers_zscore(data: Union[np.ndarray, pd.Series],
@@ -81,8 +80,9 @@ def detect_outliers_iqr(data: Union[np.ndarray, pd.Series],
 
     Parameters:
     -----------
-    data : array-like
-        Data to analyze for outliers
+    data : array-like or SortedColumn
+        Data to analyze for outliers. A SortedColumn must be built with
+        ``keep_positions=True`` so the mask can follow the original rows
     multiplier : float, default=1.5
         IQR multiplier for outlier detection
 
@@ -91,11 +91,16 @@ def detect_outliers_iqr(data: Union[np.ndarray, pd.Series],
     tuple
         (outlier_mask, quartile_info)
     """
+    if isinstance(data, SortedColumn):
+        return _detect_outliers_iqr_sorted(data, multiplier)
     if isinstance(data, np.ndarray):
         data = pd.Series(data)
 
-    Q1 = data.quantile(0.25)
-    Q3 = data.quantile(0.75)
+    if get_cache() is not None:
+        Q1, Q3 = cached_quantiles(data, [0.25, 0.75])
+    else:
+        Q1 = data.quantile(0.25)
+        Q3 = data.quantile(0.75)
     IQR = Q3 - Q1
 
     lower_bound = Q1 - multiplier * IQR
@@ -114,13 +119,277 @@ def detect_outliers_iqr(data: Union[np.ndarray, pd.Series],
     return outlier_mask, quartile_info
 
 
+def _detect_outliers_iqr_sorted(column: SortedColumn, multiplier: float) -> Tuple[pd.Series, dict]:
+    """
+    IQR outliers of a SortedColumn: the outliers are the values below the
+    lower fence and above the upper fence, located with two binary searches.
+    """
+    if column.positions is None:
+        raise ValueError("detect_outliers_iqr needs a SortedColumn built with keep_positions=True "
+                         "to map the mask back to the original rows")
+
+    quartile_info = column.iqr_bounds(multiplier)
+    low = column.rank(quartile_info['lower_bound'], side='left')
+    high = column.rank(quartile_info['upper_bound'], side='right')
+
+    # Missing values keep False, as in the comparison of the Series path
+    outlier_mask = np.zeros(column.count + column.missing, dtype=bool)
+    outlier_mask[column.positions[:low]] = True
+    outlier_mask[column.positions[high:]] = True
+
+    return pd.Series(outlier_mask, index=column.index, name=column.name), quartile_info
+
+
+def _select_median(values: np.ndarray) -> float:
+    """Median by linear-time selection (``np.partition``) instead of sorting."""
+    n = values.size
+    if n == 0:
+        return np.nan
+    middle = n // 2
+    if n % 2:
+        return np.partition(values, middle)[middle]
+    selected = np.partition(values, [middle - 1, middle])
+    return (selected[middle - 1] + selected[middle]) / 2
+
+
+def _sorted_window_median_mad(window: List[float]) -> Tuple[float, float]:
+    """
+    Median and MAD of a sorted window in O(log w) steps.
+
+    Deviations below the median (read right-to-left) and above it (read
+    left-to-right) form two sorted sequences, so the median deviation is a
+    k-th smallest element of two sorted sequences, found by binary search.
+    """
+    count = len(window)
+    split = count // 2
+    if count % 2:
+        median = window[split]
+    else:
+        median = (window[split - 1] + window[split]) / 2
+
+    n_left, n_right = split, count - split
+
+    def kth_deviation(k):
+        lo, hi = max(0, k + 1 - n_right), min(k + 1, n_left)
+        while lo < hi:
+            taken = (lo + hi) // 2
+            if median - window[split - 1 - taken] < window[split + k - taken] - median:
+                lo = taken + 1
+            else:
+                hi = taken
+        left = median - window[split - lo] if lo > 0 else -np.inf
+        right = window[split + k - lo] - median if k - lo >= 0 else -np.inf
+        return max(left, right)
+
+    if count % 2:
+        mad = kth_deviation(count // 2)
+    else:
+        mad = (kth_deviation(count // 2 - 1) + kth_deviation(count // 2)) / 2
+    return median, mad
+
+
+def detect_outliers_mad(data: Union[np.ndarray, pd.Series],
+                        threshold: float = 3.5,
+                        window: Optional[int] = None,
+                        min_periods: Optional[int] = None) -> Tuple[pd.Series, pd.Series]:
+    """
+    Detect outliers using the median absolute deviation (MAD).
+
+    The modified z-score 0.6745 * (x - median) / MAD (Iglewicz & Hoaglin)
+    is robust to the outliers it is looking for. Medians are found with
+    linear-time selection rather than a full sort.
+
+    In rolling mode each point is scored against the trailing window that
+    ends at it. The window is kept as a sorted list updated by binary search
+    insertion/removal, and the median and MAD are read from it with
+    O(log w) binary searches, so n points cost O(n log w) comparisons (plus
+    a C-level memmove per update) instead of re-selecting every window.
+
+    Parameters:
+    -----------
+    data : array-like
+        Data to analyze for outliers (in time order for rolling mode)
+    threshold : float, default=3.5
+        Modified z-score threshold for outlier detection
+    window : int, optional
+        Size of the trailing window; None scores against the whole data
+    min_periods : int, optional
+        Minimum number of valid observations in a window to produce a
+        score (defaults to ``window``)
+
+    Returns:
+    --------
+    tuple
+        (outlier_mask, modified_z_scores)
+    """
+    if isinstance(data, np.ndarray):
+        data = pd.Series(data)
+
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    if window is None:
+        clean_values = values[~np.isnan(values)]
+        median = _select_median(clean_values)
+        mad = _select_median(np.abs(clean_values - median))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scores = 0.6745 * (values - median) / mad
+    else:
+        if window < 1:
+            raise ValueError("window must be a positive integer")
+        min_periods = window if min_periods is None else min_periods
+        scores = np.full(values.size, np.nan)
+        points = values.tolist()
+        sorted_window = []
+
+        for i, value in enumerate(points):
+            if value == value:
+                bisect.insort(sorted_window, value)
+            if i >= window:
+                old = points[i - window]
+                if old == old:
+                    del sorted_window[bisect.bisect_left(sorted_window, old)]
+            if value != value or len(sorted_window) < max(min_periods, 1):
+                continue
+
+            median, mad = _sorted_window_median_mad(sorted_window)
+            if mad > 0:
+                scores[i] = 0.6745 * (value - median) / mad
+            elif value != median:
+                scores[i] = np.copysign(np.inf, value - median)
+
+    z_scores = pd.Series(scores, index=data.index, name=data.name)
+    outlier_mask = np.abs(z_scores) > threshold
+
+    return outlier_mask, z_scores
+
+
+def detect_outliers_frame(data: pd.DataFrame,
+                          method: str = 'zscore',
+                          threshold: float = 3.0,
+                          multiplier: float = 1.5,
+                          output: str = 'indices',
+                          block_rows: int = 65536) -> Tuple[Union[dict, np.ndarray], pd.DataFrame]:
+    """
+    Detect outliers in every numeric column of a DataFrame at once.
+
+    Column means/standard deviations (z-score) or quartiles (IQR, one
+    ``np.nanpercentile`` call over the 2-D array) are computed for all
+    columns together, and rows are then scanned in blocks so no full-size
+    z-score or boolean matrix is ever materialised.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe (non-numeric columns are ignored)
+    method : str, default='zscore'
+        'zscore' (same rule as ``detect_outliers_zscore``) or 'iqr' (same
+        rule as ``detect_outliers_iqr``)
+    threshold : float, default=3.0
+        Z-score threshold for outlier detection
+    multiplier : float, default=1.5
+        IQR multiplier for outlier detection
+    output : str, default='indices'
+        'indices' for a dict mapping each column to the index labels of its
+        outliers, 'packed' for a bit-packed mask (``np.packbits`` along the
+        rows, shape (ceil(n_rows / 8), n_columns))
+    block_rows : int, default=65536
+        Rows processed per block
+
+    Returns:
+    --------
+    tuple
+        (outliers, column_info) where column_info holds the per-column
+        statistics, bounds and outlier counts
+    """
+    if method not in ('zscore', 'iqr'):
+        raise ValueError(f"Unknown method: {method}")
+    if output not in ('indices', 'packed'):
+        raise ValueError(f"Unknown output: {output}")
+
+    numeric_data = data.select_dtypes(include=[np.number])
+    values = numeric_data.to_numpy(dtype=np.float64, na_value=np.nan)
+    n_rows, n_cols = values.shape
+    block_rows = max(8, block_rows - block_rows % 8)
+    blocks = range(0, n_rows, block_rows)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        if method == 'zscore':
+            count = np.zeros(n_cols)
+            total = np.zeros(n_cols)
+            for start in blocks:
+                block = values[start:start + block_rows]
+                count += (~np.isnan(block)).sum(axis=0)
+                total += np.nansum(block, axis=0)
+            mean = total / count
+
+            squared = np.zeros(n_cols)
+            for start in blocks:
+                squared += np.nansum((values[start:start + block_rows] - mean)**2, axis=0)
+            std = np.sqrt(squared / (count - 1))
+
+            def is_outlier(block):
+                return np.abs((block - mean) / std) > threshold
+
+            column_info = pd.DataFrame({'mean': mean, 'std': std}, index=numeric_data.columns)
+        else:
+            with warnings.catch_warnings():
+                # All-NaN columns simply get NaN quartiles
+                warnings.simplefilter('ignore', RuntimeWarning)
+                q1, q3 = np.nanpercentile(values, [25, 75], axis=0)
+            iqr = q3 - q1
+            lower_bound = q1 - multiplier * iqr
+            upper_bound = q3 + multiplier * iqr
+
+            def is_outlier(block):
+                return (block < lower_bound) | (block > upper_bound)
+
+            column_info = pd.DataFrame({'Q1': q1, 'Q3': q3, 'IQR': iqr,
+                                        'lower_bound': lower_bound,
+                                        'upper_bound': upper_bound},
+                                       index=numeric_data.columns)
+
+        n_outliers = np.zeros(n_cols, dtype=np.int64)
+        packed_blocks = []
+        row_positions = [[] for _ in range(n_cols)]
+        for start in blocks:
+            mask = is_outlier(values[start:start + block_rows])
+            n_outliers += mask.sum(axis=0)
+            if output == 'packed':
+                packed_blocks.append(np.packbits(mask, axis=0))
+            else:
+                cols, rows = np.nonzero(mask.T)
+                for col, positions in zip(*_split_by_group(cols, rows + start, n_cols)):
+                    row_positions[col].append(positions)
+
+    column_info['n_outliers'] = n_outliers
+
+    if output == 'packed':
+        outliers = (np.concatenate(packed_blocks, axis=0) if packed_blocks
+                    else np.zeros((0, n_cols), dtype=np.uint8))
+    else:
+        outliers = {
+            col: numeric_data.index[np.concatenate(positions) if positions
+                                    else np.empty(0, dtype=np.int64)]
+            for col, positions in zip(numeric_data.columns, row_positions)
+        }
+
+    return outliers, column_info
+
+
+def _split_by_group(sorted_groups: np.ndarray, values: np.ndarray, n_groups: int):
+    """Split ``values`` into per-group arrays, given group ids sorted ascending."""
+    boundaries = np.searchsorted(sorted_groups, np.arange(n_groups + 1))
+    groups = np.flatnonzero(np.diff(boundaries))
+    return groups, [values[boundaries[g]:boundaries[g + 1]] for g in groups]
+
+
 def comprehensive_summary_stats(data: Union[np.ndarray, pd.Series]) -> dict:
     """
     Calculate comprehensive summary statistics for a dataset.
 
     Parameters:
     -----------
-    data : array-like
+    data : array-like or SortedColumn
         Data to analyze
 
     Returns:
@@ -128,39 +397,134 @@ def comprehensive_summary_stats(data: Union[np.ndarray, pd.Series]) -> dict:
     dict
         Dictionary containing various statistical measures
     """
+    from scipy import stats
+
+    if isinstance(data, SortedColumn):
+        return data.summary()
     if isinstance(data, np.ndarray):
         data = pd.Series(data)
 
+    if get_cache() is not None:
+        return cached_sorted_column(data).summary()
+
     clean_data = data.dropna()
 
     if len(clean_data) == 0:
         return {'error': 'No valid data points'}
 
+    # Compute each order statistic and moment only once
+    q1, median, q3 = clean_data.quantile([0.25, 0.5, 0.75]).to_numpy()
+    modes = clean_data.mode()
+    mean = clean_data.mean()
+    var = clean_data.var()
+    std = np.sqrt(var)
+    min_val = clean_data.min()
+    max_val = clean_data.max()
+
     return {
         'count': len(clean_data),
         'missing': data.isnull().sum(),
-        'mean': clean_data.mean(),
-        'median': clean_data.median(),
-        'mode': clean_data.mode().iloc[0] if len(clean_data.mode()) > 0 else np.nan,
-        'std': clean_data.std(),
-        'var': clean_data.var(),
-        'min': clean_data.min(),
-        'max': clean_data.max(),
-        'range': clean_data.max() - clean_data.min(),
-        'q1': clean_data.quantile(0.25),
-        'q3': clean_data.quantile(0.75),
-        'iqr': clean_data.quantile(0.75) - clean_data.quantile(0.25),
+        'mean': mean,
+        'median': median,
+        'mode': modes.iloc[0] if len(modes) > 0 else np.nan,
+        'std': std,
+        'var': var,
+        'min': min_val,
+        'max': max_val,
+        'range': max_val - min_val,
+        'q1': q1,
+        'q3': q3,
+        'iqr': q3 - q1,
         'skewness': stats.skew(clean_data),
         'kurtosis': stats.kurtosis(clean_data),
-        'cv': clean_data.std() / clean_data.mean() if clean_data.mean() != 0 else np.nan
+        'cv': std / mean if mean != 0 else np.nan
     }
 
 
+def bin_codes(values: Union[np.ndarray, pd.Series],
+              edges: Union[np.ndarray, List],
+              right: bool = False) -> np.ndarray:
+    """
+    Assign bin codes with a binary search over sorted bin edges.
+
+    Equivalent to the codes of ``pd.cut(values, edges, right=right)`` but
+    returns a plain integer array and never touches the parent DataFrame.
+
+    Parameters:
+    -----------
+    values : array-like
+        Values to bin
+    edges : array-like
+        Monotonically increasing bin edges
+    right : bool, default=False
+        Whether bins include their right edge instead of their left edge
+
+    Returns:
+    --------
+    np.ndarray
+        Bin index per value, -1 for NaN or out-of-range values
+    """
+    edges = np.asarray(edges, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+
+    codes = np.searchsorted(edges, values, side='left' if right else 'right') - 1
+    codes[(codes < 0) | (codes >= len(edges) - 1)] = -1
+
+    return codes
+
+
+def _grouped_stats(codes: np.ndarray, values: np.ndarray, n_bins: int) -> dict:
+    """
+    Count, mean, median, std, min and max of ``values`` per group code.
+
+    Counts, sums and squared deviations are scatter reductions with
+    ``np.bincount``; values are then grouped with one stable sort of the
+    small integer codes, giving min/max through ``reduceat`` and medians
+    through an O(size) ``np.partition`` selection per group.
+    """
+    valid = (codes >= 0) & ~np.isnan(values)
+    group = codes[valid]
+    values = values[valid]
+
+    count = np.bincount(group, minlength=n_bins)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.bincount(group, weights=values, minlength=n_bins) / count
+        deviations = values - mean[group]
+        std = np.sqrt(np.bincount(group, weights=deviations * deviations,
+                                  minlength=n_bins) / (count - 1))
+    std[count < 2] = np.nan
+
+    sorted_values = values[np.argsort(group, kind='stable')]
+    stops = np.cumsum(count)
+    starts = stops - count
+    non_empty = count > 0
+
+    minimum = np.full(n_bins, np.nan)
+    maximum = np.full(n_bins, np.nan)
+    if sorted_values.size:
+        minimum[non_empty] = np.minimum.reduceat(sorted_values, starts[non_empty])
+        maximum[non_empty] = np.maximum.reduceat(sorted_values, starts[non_empty])
+
+    median = np.full(n_bins, np.nan)
+    for b in np.flatnonzero(non_empty):
+        segment = sorted_values[starts[b]:stops[b]]
+        middle = segment.size // 2
+        if segment.size % 2:
+            median[b] = np.partition(segment, middle)[middle]
+        else:
+            selected = np.partition(segment, [middle - 1, middle])
+            median[b] = (selected[middle - 1] + selected[middle]) / 2
+
+    return {'count': count, 'mean': mean, 'median': median,
+            'std': std, 'min': minimum, 'max': maximum}
+
+
 def binning_analysis(data: pd.DataFrame,
                     bin_column: str,
                     target_columns: List[str],
                     bins: Union[int, List],
-                    labels: Optional[List] = None) -> pd.DataFrame:
+                    labels: Optional[List] = None,
+                    engine: str = 'pandas') -> pd.DataFrame:
     """
     Perform binning analysis with comprehensive statistics.
 
@@ -176,12 +540,21 @@ def binning_analysis(data: pd.DataFrame,
         Bin edges or number of bins
     labels : list, optional
         Labels for the bins
+    engine : str, default='pandas'
+        'pandas' copies the frame and uses ``groupby().agg``; 'numpy' bins
+        the column with a binary search and reduces each target column with
+        scatter reductions, without copying the frame
 
     Returns:
     --------
     pd.DataFrame
         Binned analysis results
     """
+    if engine == 'numpy':
+        return _binning_analysis_numpy(data, bin_column, target_columns, bins, labels)
+    if engine != 'pandas':
+        raise ValueError(f"Unknown engine: {engine}")
+
     df_copy = data.copy()
 
     # Create bins
@@ -201,11 +574,187 @@ def binning_analysis(data: pd.DataFrame,
     return result.reset_index()
 
 
+def _binning_analysis_numpy(data: pd.DataFrame,
+                            bin_column: str,
+                            target_columns: List[str],
+                            bins: Union[int, List],
+                            labels: Optional[List] = None) -> pd.DataFrame:
+    """Copy-free implementation of ``binning_analysis`` (engine='numpy')."""
+    bin_values = data[bin_column].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Bin edges and categories only depend on the range of the bin column,
+    # so let pd.cut derive them (same rounding of labels) from two values
+    valid_bins = bin_values[~np.isnan(bin_values)]
+    bounds = np.array([valid_bins.min(), valid_bins.max()]) if valid_bins.size else np.array([np.nan] * 2)
+    categories, edges = pd.cut(bounds, bins=bins, labels=labels, right=False, retbins=True)
+    categories = categories.categories
+    n_bins = len(edges) - 1
+
+    codes = bin_codes(bin_values, edges)
+    codes = codes.astype(np.int16 if n_bins < np.iinfo(np.int16).max else np.int64)
+
+    result = {'bin': pd.Categorical.from_codes(np.arange(n_bins), categories=categories,
+                                               ordered=True)}
+    for col in target_columns:
+        values = data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        for stat, column_values in _grouped_stats(codes, values, n_bins).items():
+            result[f'{col}_{stat}'] = column_values
+
+    return pd.DataFrame(result)
+
+
+def _correlation_p_values_flat(r: np.ndarray, n: np.ndarray, method: str) -> np.ndarray:
+    """Two-sided p-values for a flat array of coefficients and their sample sizes."""
+    from scipy import stats
+
+    r = np.clip(r, -1.0, 1.0)
+    abs_r = np.abs(r)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if method == 'kendall':
+            # Normal approximation of tau under independence
+            z = 3 * abs_r * np.sqrt(n * (n - 1)) / np.sqrt(2 * (2 * n + 5))
+            p_values = 2 * stats.norm.sf(z)
+        else:
+            df = n - 2
+            t_stat = abs_r * np.sqrt(df / (1 - abs_r**2))
+            p_values = 2 * stats.t.sf(t_stat, df)
+
+    p_values = np.where(abs_r == 1.0, 0.0, p_values)
+    return np.where(np.isnan(r) | (n < 3), np.nan, p_values)
+
+
+def correlation_p_values(corr_matrix: Union[np.ndarray, pd.DataFrame],
+                         n: Union[int, np.ndarray],
+                         method: str = 'pearson') -> np.ndarray:
+    """
+    Calculate two-sided p-values for a whole correlation matrix at once.
+
+    Only the upper triangle is evaluated; the result is mirrored so the
+    returned matrix is symmetric with zeros on the diagonal. Pearson and
+    Spearman coefficients use the t-distribution with n - 2 degrees of
+    freedom, Kendall's tau uses the large-sample normal approximation
+    (without tie correction). Perfect correlations (r = +/-1) get a p-value
+    of 0 and undefined coefficients (NaN, or n too small) get NaN, both
+    without runtime warnings.
+
+    Parameters:
+    -----------
+    corr_matrix : array-like
+        Square correlation matrix
+    n : int or array-like
+        Sample size, either shared by all pairs or one per pair (square matrix)
+    method : str, default='pearson'
+        Correlation method ('pearson', 'spearman', 'kendall')
+
+    Returns:
+    --------
+    np.ndarray
+        Symmetric matrix of p-values
+    """
+    if method not in ('pearson', 'spearman', 'kendall'):
+        raise ValueError(f"Unknown correlation method: {method}")
+
+    r_full = np.asarray(corr_matrix, dtype=float)
+    n_cols = r_full.shape[0]
+    rows, cols = np.triu_indices(n_cols, k=1)
+
+    n_pairs = np.broadcast_to(np.asarray(n, dtype=float), r_full.shape)[rows, cols]
+    p_upper = _correlation_p_values_flat(r_full[rows, cols], n_pairs, method)
+
+    p_values = np.zeros((n_cols, n_cols))
+    p_values[rows, cols] = p_upper
+    p_values[cols, rows] = p_upper
+
+    return p_values
+
+
+def _masked_correlation(centered_a: np.ndarray, weights_a: np.ndarray,
+                        centered_b: np.ndarray, weights_b: np.ndarray):
+    """
+    Pairwise-complete Pearson correlations between the columns of two blocks.
+
+    ``centered_*`` hold the column-centered values with 0 where missing and
+    ``weights_*`` the validity masks as floats. Returns the correlation
+    block, the pairwise counts and the sums of squares of block a.
+    """
+    n_obs = weights_a.T @ weights_b
+    sums_a = centered_a.T @ weights_b      # sums_a[i, j]: sum of a_i where b_j is valid
+    squares_a = (centered_a**2).T @ weights_b
+    if centered_b is centered_a and weights_b is weights_a:
+        sums_b, squares_b = sums_a.T, squares_a.T
+    else:
+        sums_b = (centered_b.T @ weights_a).T  # sums_b[i, j]: sum of b_j where a_i is valid
+        squares_b = ((centered_b**2).T @ weights_a).T
+    cross_products = centered_a.T @ centered_b
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = cross_products - sums_a * sums_b / n_obs
+        var_a = squares_a - sums_a**2 / n_obs
+        var_b = squares_b - sums_b**2 / n_obs
+        corr = cov / np.sqrt(var_a * var_b)
+
+    corr = np.clip(corr, -1.0, 1.0)
+    corr[n_obs < 2] = np.nan
+    return corr, n_obs, var_a
+
+
+def pairwise_correlation(data: pd.DataFrame,
+                         dtype: type = np.float64) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """
+    Pearson correlation on pairwise-complete observations via masked matrix products.
+
+    For every pair of columns only the rows where both values are present
+    are used, matching ``DataFrame.corr``. Instead of building a filtered
+    copy per pair, the counts, sums, sums of squares and cross-products over
+    the validity mask are obtained from a handful of p x p matrix products,
+    so the cost is O(n * p^2) BLAS work for the whole matrix.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe (non-numeric columns are ignored)
+    dtype : numpy dtype, default=np.float64
+        Floating point type used for the matrix products
+
+    Returns:
+    --------
+    tuple
+        (correlation_matrix, p_values_matrix, n_obs_matrix)
+    """
+    numeric_data = data.select_dtypes(include=[np.number])
+    columns = numeric_data.columns
+
+    values = numeric_data.to_numpy(dtype=dtype, na_value=np.nan)
+    mask = ~np.isnan(values)
+    weights = mask.astype(dtype)
+
+    # Center each column on its own mean to limit cancellation in the sums
+    col_counts = mask.sum(axis=0)
+    col_means = np.nansum(values, axis=0) / np.maximum(col_counts, 1)
+    centered = np.where(mask, values - col_means, 0.0).astype(dtype, copy=False)
+
+    corr, n_obs, var_i = _masked_correlation(centered, weights, centered, weights)
+
+    np.fill_diagonal(corr, np.where(np.diag(var_i) > 0, 1.0, np.nan))
+
+    p_values = correlation_p_values(corr, n_obs, method='pearson')
+    n_obs_int = n_obs.astype(np.int64)
+
+    return (pd.DataFrame(corr, index=columns, columns=columns),
+            pd.DataFrame(p_values, index=columns, columns=columns),
+            pd.DataFrame(n_obs_int, index=columns, columns=columns))
+
+
 def correlation_analysis(data: pd.DataFrame,
                         method: str = 'pearson') -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Perform comprehensive correlation analysis.
 
+    Spearman and Kendall coefficients come from ``rank_correlation``, which
+    ranks each column once (with missing values, Spearman ranks are taken
+    over each column's own non-missing values rather than per pair).
+
     Parameters:
     -----------
     data : pd.DataFrame
@@ -218,37 +767,356 @@ def correlation_analysis(data: pd.DataFrame,
     tuple
         (correlation_matrix, p_values_matrix)
     """
+    if method in ('spearman', 'kendall'):
+        # Rank every column once instead of re-ranking per pair
+        from .rank_correlation import rank_correlation_analysis
+        return rank_correlation_analysis(data, method=method)
+
     # Select only numeric columns
     numeric_data = data.select_dtypes(include=[np.number])
 
-    if method == 'pearson':
-        corr_matrix = numeric_data.corr(method='pearson')
-        # Calculate p-values
+    corr_matrix = numeric_data.corr(method=method)
+
+    # Calculate p-values for the whole matrix in one vectorized pass,
+    # using per-pair sample sizes when missing values are present
+    valid = numeric_data.notna().to_numpy()
+    if valid.all():
         n = len(numeric_data)
-        p_values = np.zeros((len(numeric_data.columns), len(numeric_data.columns)))
-
-        for i, col1 in enumerate(numeric_data.columns):
-            for j, col2 in enumerate(numeric_data.columns):
-                if i != j:
-                    r = corr_matrix.iloc[i, j]
-                    t_stat = r * np.sqrt((n - 2) / (1 - r**2))
-                    p_values[i, j] = 2 * (1 - stats.t.cdf(abs(t_stat), n - 2))
-                else:
-                    p_values[i, j] = 0
-
-        p_values_df = pd.DataFrame(p_values,
-                                  index=numeric_data.columns,
-                                  columns=numeric_data.columns)
     else:
-        corr_matrix = numeric_data.corr(method=method)
-        p_values_df = pd.DataFrame(np.nan,
-                                  index=numeric_data.columns,
-                                  columns=numeric_data.columns)
-        warnings.warn(f"P-values not calculated for {method} correlation")
+        weights = valid.astype(np.float64)
+        n = weights.T @ weights
+    p_values = correlation_p_values(corr_matrix.to_numpy(), n, method=method)
+
+    p_values_df = pd.DataFrame(p_values,
+                              index=numeric_data.columns,
+                              columns=numeric_data.columns)
 
     return corr_matrix, p_values_df
 
 
+def _prepare_correlation_columns(data: pd.DataFrame, dtype: type):
+    """
+    Column-centered numeric values for block correlations.
+
+    Without missing values the columns are also scaled to unit norm, so a
+    block of correlations is a single matrix product and ``weights`` is
+    None; otherwise missing entries are 0 and ``weights`` is the validity
+    mask for ``_masked_correlation``.
+    """
+    numeric_data = data.select_dtypes(include=[np.number])
+    values = numeric_data.to_numpy(dtype=dtype, na_value=np.nan)
+    mask = ~np.isnan(values)
+    col_means = np.nansum(values, axis=0) / np.maximum(mask.sum(axis=0), 1)
+    centered = np.where(mask, values - col_means, 0.0).astype(dtype, copy=False)
+
+    if mask.all():
+        norms = np.sqrt(np.einsum('ij,ij->j', centered, centered))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centered /= np.where(norms > 0, norms, np.nan).astype(dtype)
+        return numeric_data.columns, centered, None
+    return numeric_data.columns, centered, mask.astype(dtype)
+
+
+def _correlation_block(centered: np.ndarray, weights: Optional[np.ndarray],
+                       rows: slice, cols: slice) -> Tuple[np.ndarray, np.ndarray]:
+    """Correlations and pairwise counts between two column ranges."""
+    if weights is None:
+        corr = np.clip(centered[:, rows].T @ centered[:, cols], -1.0, 1.0)
+        return corr, np.full(corr.shape, centered.shape[0], dtype=np.float64)
+    corr, n_obs, _ = _masked_correlation(centered[:, rows], weights[:, rows],
+                                         centered[:, cols], weights[:, cols])
+    return corr, n_obs
+
+
+def _iter_upper_blocks(n_cols: int, block_size: int):
+    """(rows, cols) slice pairs covering the upper triangle block by block."""
+    for row_start in range(0, n_cols, block_size):
+        for col_start in range(row_start, n_cols, block_size):
+            yield (slice(row_start, min(row_start + block_size, n_cols)),
+                   slice(col_start, min(col_start + block_size, n_cols)))
+
+
+def correlation_blocks(data: pd.DataFrame,
+                       block_size: int = 2048,
+                       dtype: type = np.float64) -> Iterator[Tuple[pd.DataFrame, pd.DataFrame]]:
+    """
+    Generate the Pearson correlation matrix block by block.
+
+    Only blocks on or above the diagonal are produced, so every pair of
+    columns appears once (twice within diagonal blocks). Peak memory is the
+    centered data plus O(block_size^2) per block, so matrices far larger
+    than memory can be scanned. Missing values are handled pairwise as in
+    ``pairwise_correlation``.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe (non-numeric columns are ignored)
+    block_size : int, default=2048
+        Number of columns per block side
+    dtype : numpy dtype, default=np.float64
+        Floating point type used for the matrix products
+
+    Yields:
+    -------
+    tuple
+        (correlation_block, n_obs_block) DataFrames labelled with the
+        block's row and column names
+    """
+    columns, centered, weights = _prepare_correlation_columns(data, dtype)
+    for rows, cols in _iter_upper_blocks(len(columns), block_size):
+        corr, n_obs = _correlation_block(centered, weights, rows, cols)
+        yield (pd.DataFrame(corr, index=columns[rows], columns=columns[cols]),
+               pd.DataFrame(n_obs.astype(np.int64), index=columns[rows], columns=columns[cols]))
+
+
+def _pair_correlations(centered: np.ndarray, weights: Optional[np.ndarray],
+                       first: np.ndarray, second: np.ndarray,
+                       pairs_per_chunk: int = 1024) -> Tuple[np.ndarray, np.ndarray]:
+    """Exact correlations and counts for explicit column pairs, in chunks of pairs."""
+    corr = np.empty(first.size)
+    n_obs = np.empty(first.size)
+    for start in range(0, first.size, pairs_per_chunk):
+        a = first[start:start + pairs_per_chunk]
+        b = second[start:start + pairs_per_chunk]
+        x, y = centered[:, a], centered[:, b]
+        if weights is None:
+            corr[start:start + a.size] = np.einsum('ij,ij->j', x, y)
+            n_obs[start:start + a.size] = centered.shape[0]
+            continue
+        both = weights[:, a] * weights[:, b]
+        count = both.sum(axis=0)
+        sum_x, sum_y = np.einsum('ij,ij->j', x, both), np.einsum('ij,ij->j', y, both)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cov = np.einsum('ij,ij,ij->j', x, y, both) - sum_x * sum_y / count
+            var_x = np.einsum('ij,ij,ij->j', x, x, both) - sum_x**2 / count
+            var_y = np.einsum('ij,ij,ij->j', y, y, both) - sum_y**2 / count
+            corr[start:start + a.size] = np.where(count >= 2, cov / np.sqrt(var_x * var_y), np.nan)
+        n_obs[start:start + a.size] = count
+    return np.clip(corr, -1.0, 1.0), n_obs
+
+
+def _sketch_candidates(centered: np.ndarray, k: Optional[int], threshold: Optional[float],
+                       block_size: int, sketch_dim: int, oversample: int, margin: float,
+                       seed: Optional[int], dtype: type) -> Tuple[np.ndarray, np.ndarray]:
+    """Candidate pairs whose correlation estimated from a random projection is large."""
+    rng = np.random.default_rng(seed)
+    n_rows, n_cols = centered.shape
+    sketch = np.zeros((sketch_dim, n_cols), dtype=dtype)
+    # Project in row chunks so the Gaussian matrix never exceeds sketch_dim x 65536
+    for start in range(0, n_rows, 65536):
+        chunk = centered[start:start + 65536]
+        sketch += rng.standard_normal((sketch_dim, chunk.shape[0])).astype(dtype) @ chunk
+    norms = np.sqrt(np.einsum('ij,ij->j', sketch, sketch))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sketch /= np.where(norms > 0, norms, np.nan).astype(dtype)
+
+    n_candidates = None if k is None else k * oversample
+    cutoff = None if threshold is None else max(threshold - margin, 0.0)
+    return _select_pairs(sketch, None, n_cols, block_size, n_candidates, cutoff)[:2]
+
+
+def _select_pairs(centered: np.ndarray, weights: Optional[np.ndarray], n_cols: int,
+                  block_size: int, k: Optional[int], threshold: Optional[float]):
+    """Scan the upper triangle block by block, keeping the top-k and/or |r| >= threshold pairs."""
+    kept_first, kept_second = np.empty(0, np.intp), np.empty(0, np.intp)
+    kept_corr, kept_n = np.empty(0), np.empty(0)
+
+    for rows, cols in _iter_upper_blocks(n_cols, block_size):
+        corr, n_obs = _correlation_block(centered, weights, rows, cols)
+        strength = np.nan_to_num(np.abs(corr), nan=-1.0)
+        if rows.start == cols.start:
+            strength[np.tril_indices(strength.shape[0], m=strength.shape[1])] = -1.0
+        if threshold is not None:
+            strength[strength < threshold] = -1.0
+        if k is not None and strength.size > k:
+            flat = np.argpartition(strength, -k, axis=None)[-k:]
+        else:
+            flat = np.arange(strength.size)
+        flat = flat[strength.ravel()[flat] >= 0]
+        i, j = np.unravel_index(flat, strength.shape)
+
+        kept_first = np.concatenate([kept_first, i + rows.start])
+        kept_second = np.concatenate([kept_second, j + cols.start])
+        kept_corr = np.concatenate([kept_corr, corr[i, j]])
+        kept_n = np.concatenate([kept_n, n_obs[i, j]])
+        if k is not None and kept_corr.size > k:
+            best = np.argpartition(np.abs(kept_corr), -k)[-k:]
+            kept_first, kept_second = kept_first[best], kept_second[best]
+            kept_corr, kept_n = kept_corr[best], kept_n[best]
+
+    return kept_first, kept_second, kept_corr, kept_n
+
+
+def top_correlated_pairs(data: pd.DataFrame,
+                         k: Optional[int] = 100,
+                         threshold: Optional[float] = None,
+                         block_size: int = 2048,
+                         sketch_dim: Optional[int] = None,
+                         oversample: int = 10,
+                         margin: float = 0.1,
+                         seed: Optional[int] = None,
+                         dtype: type = np.float64) -> pd.DataFrame:
+    """
+    Find the most strongly correlated column pairs without building the p x p matrix.
+
+    The correlation matrix is scanned in column blocks (see
+    ``correlation_blocks``), keeping only the k strongest pairs by |r|
+    and/or the pairs with |r| >= threshold, so peak memory is the centered
+    data plus O(block_size^2).
+
+    With ``sketch_dim`` the rows are first compressed by a Gaussian random
+    projection to ``sketch_dim`` dimensions, which preserves correlations
+    up to an error of about 1 / sqrt(sketch_dim). The cheap sketched
+    correlations select ``oversample * k`` candidates (or those above
+    ``threshold - margin``), and only these are verified exactly on the
+    full data. This is approximate: a true pair missed by the sketch is not
+    recovered.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        Input dataframe (non-numeric columns are ignored)
+    k : int, optional, default=100
+        Number of strongest pairs to return (None for all pairs above
+        ``threshold``)
+    threshold : float, optional
+        Minimum absolute correlation of returned pairs
+    block_size : int, default=2048
+        Number of columns per block side
+    sketch_dim : int, optional
+        Dimension of the random projection prefilter (None for an exact scan)
+    oversample : int, default=10
+        Candidates per requested pair kept by the prefilter
+    margin : float, default=0.1
+        Slack subtracted from ``threshold`` by the prefilter
+    seed : int, optional
+        Seed of the random projection
+    dtype : numpy dtype, default=np.float64
+        Floating point type used for the matrix products
+
+    Returns:
+    --------
+    pd.DataFrame
+        Columns column_a, column_b, correlation, p_value and n_obs, sorted by
+        decreasing |correlation|
+    """
+    if k is None and threshold is None:
+        raise ValueError("Specify k, threshold or both")
+
+    columns, centered, weights = _prepare_correlation_columns(data, dtype)
+    n_cols = len(columns)
+
+    if sketch_dim is None:
+        first, second, corr, n_obs = _select_pairs(centered, weights, n_cols, block_size, k, threshold)
+    else:
+        first, second = _sketch_candidates(centered, k, threshold, block_size, sketch_dim,
+                                           oversample, margin, seed, dtype)
+        corr, n_obs = _pair_correlations(centered, weights, first, second)
+        keep = ~np.isnan(corr)
+        if threshold is not None:
+            keep &= np.abs(corr) >= threshold
+        first, second, corr, n_obs = first[keep], second[keep], corr[keep], n_obs[keep]
+
+    order = np.argsort(-np.abs(corr), kind='stable')
+    if k is not None:
+        order = order[:k]
+    first, second, corr, n_obs = first[order], second[order], corr[order], n_obs[order]
+
+    return pd.DataFrame({
+        'column_a': columns[first],
+        'column_b': columns[second],
+        'correlation': corr,
+        'p_value': _correlation_p_values_flat(corr, n_obs, 'pearson'),
+        'n_obs': n_obs.astype(np.int64)
+    })
+
+
+def linear_regression_bands(x: Union[np.ndarray, pd.Series],
+                            y: Union[np.ndarray, pd.Series],
+                            x_grid: Optional[np.ndarray] = None,
+                            n_grid: int = 100,
+                            confidence_level: float = 0.95) -> dict:
+    """
+    Simple OLS fit with analytic confidence and prediction bands.
+
+    The fit uses one pass of sufficient statistics over the pairwise-valid
+    rows (n, the means, Sxx, Sxy and Syy, accumulated on centered values
+    for numerical stability); the bands are the exact t-based intervals
+    for the mean response and for a new observation, so no resampling is
+    needed however large the data.
+
+    Parameters:
+    -----------
+    x, y : array-like
+        Predictor and response; rows where either is NaN are dropped
+    x_grid : array-like, optional
+        Points at which to evaluate the fit and bands (defaults to
+        ``n_grid`` points spanning the observed x range)
+    n_grid : int, default=100
+        Number of grid points when ``x_grid`` is not given
+    confidence_level : float, default=0.95
+        Coverage of both bands
+
+    Returns:
+    --------
+    dict
+        slope, intercept, correlation, r_squared, residual_std, n_obs,
+        confidence_level, and the grid arrays x, fit, ci_lower, ci_upper,
+        pi_lower and pi_upper
+    """
+    from scipy import stats
+
+    x = pd.Series(x).to_numpy(dtype=np.float64, na_value=np.nan)
+    y = pd.Series(y).to_numpy(dtype=np.float64, na_value=np.nan)
+    if x.shape != y.shape:
+        raise ValueError("x and y must have the same length")
+    valid = ~(np.isnan(x) | np.isnan(y))
+    if not valid.all():
+        x, y = x[valid], y[valid]
+
+    n = x.size
+    if n < 3:
+        raise ValueError("At least 3 pairwise-valid observations are required")
+
+    mean_x, mean_y = x.mean(), y.mean()
+    dx, dy = x - mean_x, y - mean_y
+    sxx, sxy, syy = dx @ dx, dx @ dy, dy @ dy
+    if sxx == 0:
+        raise ValueError("x is constant; the regression is undefined")
+
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    correlation = sxy / np.sqrt(sxx * syy) if syy > 0 else np.nan
+    residual_var = max(syy - slope * sxy, 0.0) / (n - 2)
+
+    if x_grid is None:
+        x_grid = np.linspace(x.min(), x.max(), n_grid)
+    x_grid = np.asarray(x_grid, dtype=np.float64)
+    fit = intercept + slope * x_grid
+
+    t_crit = stats.t.ppf((1 + confidence_level) / 2, n - 2)
+    leverage = 1 / n + (x_grid - mean_x)**2 / sxx
+    ci_half = t_crit * np.sqrt(residual_var * leverage)
+    pi_half = t_crit * np.sqrt(residual_var * (1 + leverage))
+
+    return {
+        'slope': slope,
+        'intercept': intercept,
+        'correlation': correlation,
+        'r_squared': correlation**2,
+        'residual_std': np.sqrt(residual_var),
+        'n_obs': n,
+        'confidence_level': confidence_level,
+        'x': x_grid,
+        'fit': fit,
+        'ci_lower': fit - ci_half,
+        'ci_upper': fit + ci_half,
+        'pi_lower': fit - pi_half,
+        'pi_upper': fit + pi_half
+    }
+
+
 # Example usage and testing functions
 if __name__ == "__main__":
     # Test the functions with sample data
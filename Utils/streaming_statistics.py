@@ -0,0 +1,1120 @@
+"""
+Streaming Statistics Module
+Author: Md Ayan Alam (GF202342645)
+Description: Single-pass, bounded-memory accumulators for data that does not fit in memory
+"""
+
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from typing import Callable, Union, Iterable, Iterator, List, Optional, Tuple
+
+from .data_io import detect_format, iter_feather_batches, load_columns
+from .statistical_functions import bin_codes, correlation_p_values
+
+
+class MomentAccumulator:
+    """
+    Single-pass accumulator for count, mean, central moments, min and max.
+
+    Each chunk is reduced to its own count, mean and central moment sums
+    (M2, M3, M4), which are then combined with the running state using the
+    pairwise update formulas of Pébay (2008), a higher-order generalisation
+    of Welford's algorithm. The result does not depend on how the data was
+    split into chunks, up to floating point rounding.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray) -> 'MomentAccumulator':
+        """
+        Add a chunk of values (NaNs must already be removed).
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Chunk of finite values
+
+        Returns:
+        --------
+        MomentAccumulator
+            self, to allow chaining
+        """
+        values = np.asarray(values, dtype=np.float64)
+        n = values.size
+        if n == 0:
+            return self
+
+        mean = values.mean()
+        dev = values - mean
+        dev2 = dev * dev
+
+        self._combine(n, mean, dev2.sum(), (dev2 * dev).sum(), (dev2 * dev2).sum(),
+                      values.min(), values.max())
+        return self
+
+    def merge(self, other: 'MomentAccumulator') -> 'MomentAccumulator':
+        """
+        Fold another accumulator (e.g. from a different shard) into this one.
+
+        Parameters:
+        -----------
+        other : MomentAccumulator
+            Accumulator built over a disjoint part of the data
+
+        Returns:
+        --------
+        MomentAccumulator
+            self, now describing the union of both parts
+        """
+        self._combine(other.count, other.mean, other.m2, other.m3, other.m4,
+                      other.min, other.max)
+        return self
+
+    def _combine(self, n_b: int, mean_b: float, m2_b: float, m3_b: float, m4_b: float,
+                 min_b: float, max_b: float):
+        """Combine the running state with the moments of another partition."""
+        n_a = self.count
+        if n_b == 0:
+            return
+        if n_a == 0:
+            self.count, self.mean = n_b, mean_b
+            self.m2, self.m3, self.m4 = m2_b, m3_b, m4_b
+            self.min, self.max = min_b, max_b
+            return
+
+        n = n_a + n_b
+        delta = mean_b - self.mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term = delta * delta_n * n_a * n_b
+
+        m4 = (self.m4 + m4_b
+              + term * delta_n2 * (n_a * n_a - n_a * n_b + n_b * n_b)
+              + 6 * delta_n2 * (n_a * n_a * m2_b + n_b * n_b * self.m2)
+              + 4 * delta_n * (n_a * m3_b - n_b * self.m3))
+        m3 = (self.m3 + m3_b
+              + term * delta_n * (n_a - n_b)
+              + 3 * delta_n * (n_a * m2_b - n_b * self.m2))
+        m2 = self.m2 + m2_b + term
+
+        self.count = n
+        self.mean = self.mean + n_b * delta_n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, min_b)
+        self.max = max(self.max, max_b)
+
+    @property
+    def var(self) -> float:
+        """Sample variance (ddof=1)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else np.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        return np.sqrt(self.var)
+
+    @property
+    def skewness(self) -> float:
+        """Biased sample skewness, as returned by ``scipy.stats.skew``."""
+        if self.count == 0 or self.m2 <= 0:
+            return np.nan
+        return np.sqrt(self.count) * self.m3 / self.m2**1.5
+
+    @property
+    def kurtosis(self) -> float:
+        """Biased excess (Fisher) kurtosis, as returned by ``scipy.stats.kurtosis``."""
+        if self.count == 0 or self.m2 <= 0:
+            return np.nan
+        return self.count * self.m4 / self.m2**2 - 3.0
+
+
+class KLLSketch:
+    """
+    Bounded-memory quantile sketch (Karnin, Lang & Liberty, 2016).
+
+    Items live in a hierarchy of levels where an item on level h stands for
+    2**h original values. When a level overflows it is sorted and every
+    other item (random offset) is promoted to the next level. Memory stays
+    at O(k) items regardless of the stream length.
+
+    Error bound: for a stream of n values, the rank of any value returned by
+    ``quantile`` differs from the requested rank by at most about
+    ``epsilon * n``, where epsilon is roughly 1.65% for the default k=200
+    (with 99% confidence) and shrinks proportionally to 1/k. Mode estimates
+    inherit the same bound on their frequencies. While no more than k values
+    have been seen the sketch is exact.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None):
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self._levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(8, int(np.ceil(self.k * (2.0 / 3.0)**depth)))
+
+    def update(self, values: np.ndarray) -> 'KLLSketch':
+        """
+        Add a chunk of values (NaNs must already be removed).
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Chunk of finite values
+
+        Returns:
+        --------
+        KLLSketch
+            self, to allow chaining
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return self
+        self.count += values.size
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """
+        Fold another sketch into this one; the error bound is preserved.
+
+        Parameters:
+        -----------
+        other : KLLSketch
+            Sketch built over a disjoint part of the data
+
+        Returns:
+        --------
+        KLLSketch
+            self, now summarising the union of both parts
+        """
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for h, level in enumerate(other._levels):
+            self._levels[h] = np.concatenate([self._levels[h], level])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _compress(self):
+        """Compact overflowing levels until the sketch fits its capacity."""
+        while sum(level.size for level in self._levels) > \
+                sum(self._capacity(h) for h in range(len(self._levels))):
+            for h, level in enumerate(self._levels):
+                if level.size >= self._capacity(h):
+                    if h + 1 == len(self._levels):
+                        self._levels.append(np.empty(0))
+                    items = np.sort(level)
+                    # Keep one item back when the level has an odd size
+                    if items.size % 2 == 1:
+                        keep, items = items[-1:], items[:-1]
+                    else:
+                        keep = items[:0]
+                    offset = self._rng.integers(2)
+                    self._levels[h] = keep
+                    self._levels[h + 1] = np.concatenate([self._levels[h + 1], items[offset::2]])
+                    break
+
+    def _weighted_items(self):
+        """Return retained items sorted by value together with their weights."""
+        items = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(level.size, 2.0**h)
+                                  for h, level in enumerate(self._levels)])
+        order = np.argsort(items, kind='stable')
+        return items[order], weights[order]
+
+    @property
+    def is_exact(self) -> bool:
+        """True while no compaction has happened and every value is retained."""
+        return len(self._levels) == 1
+
+    def quantile(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Estimate one or more quantiles.
+
+        Parameters:
+        -----------
+        q : float or array-like
+            Quantile(s) in [0, 1]
+
+        Returns:
+        --------
+        float or np.ndarray
+            Estimated quantile value(s); exact (linear interpolation, as in
+            pandas) while the sketch has not compacted
+        """
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+        if self.is_exact:
+            return np.quantile(self._levels[0], q)
+
+        items, weights = self._weighted_items()
+        cumulative = np.cumsum(weights)
+        target = np.asarray(q, dtype=float) * cumulative[-1]
+        idx = np.clip(np.searchsorted(cumulative, target, side='left'), 0, items.size - 1)
+        result = items[idx]
+        return result if np.ndim(q) else float(result)
+
+    def mode(self) -> float:
+        """
+        Estimate the most frequent value.
+
+        Returns:
+        --------
+        float
+            Value with the largest estimated frequency (smallest on ties)
+        """
+        if self.count == 0:
+            return np.nan
+        items, weights = self._weighted_items()
+        unique, inverse = np.unique(items, return_inverse=True)
+        frequencies = np.bincount(inverse, weights=weights)
+        return float(unique[np.argmax(frequencies)])
+
+
+class FrequencyTable:
+    """
+    Exact value counts that give up once too many distinct values are seen.
+
+    Low-cardinality columns (ages, scores rounded to integers, codes) get
+    exact quantiles and modes from the table; ``active`` turns False and the
+    table is released as soon as ``max_distinct`` is exceeded.
+    """
+
+    def __init__(self, max_distinct: int = 10_000):
+        self.max_distinct = max_distinct
+        self.active = max_distinct > 0
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> 'FrequencyTable':
+        """
+        Add a chunk of values (NaNs must already be removed).
+
+        Parameters:
+        -----------
+        values : np.ndarray
+            Chunk of finite values
+
+        Returns:
+        --------
+        FrequencyTable
+            self, to allow chaining
+        """
+        if not self.active or np.size(values) == 0:
+            return self
+        chunk_values, chunk_counts = np.unique(values, return_counts=True)
+        self._combine(chunk_values, chunk_counts)
+        return self
+
+    def merge(self, other: 'FrequencyTable') -> 'FrequencyTable':
+        """
+        Fold another table into this one.
+
+        Parameters:
+        -----------
+        other : FrequencyTable
+            Table built over a disjoint part of the data
+
+        Returns:
+        --------
+        FrequencyTable
+            self; inactive if either table was inactive
+        """
+        if not other.active:
+            self._deactivate()
+        elif self.active and other.values.size:
+            self._combine(other.values, other.counts)
+        return self
+
+    def _combine(self, other_values: np.ndarray, other_counts: np.ndarray):
+        """Add another set of (sorted, unique) values and counts to the table."""
+        if other_values.size > self.max_distinct:
+            self._deactivate()
+            return
+        merged, inverse = np.unique(np.concatenate([self.values, other_values]),
+                                    return_inverse=True)
+        if merged.size > self.max_distinct:
+            self._deactivate()
+            return
+        self.counts = np.bincount(inverse, weights=np.concatenate([self.counts, other_counts]),
+                                  minlength=merged.size).astype(np.int64)
+        self.values = merged
+
+    def _deactivate(self):
+        self.active = False
+        self.values = np.empty(0)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def quantile(self, q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+        """
+        Exact quantiles with linear interpolation, as in pandas.
+
+        Parameters:
+        -----------
+        q : float or array-like
+            Quantile(s) in [0, 1]
+
+        Returns:
+        --------
+        float or np.ndarray
+            Quantile value(s)
+        """
+        cumulative = np.cumsum(self.counts)
+        position = np.asarray(q, dtype=float) * (cumulative[-1] - 1)
+        lower = np.floor(position)
+        fraction = position - lower
+        lower_value = self.values[np.searchsorted(cumulative, lower, side='right')]
+        upper_value = self.values[np.searchsorted(cumulative, np.ceil(position), side='right')]
+        return lower_value + fraction * (upper_value - lower_value)
+
+    def mode(self) -> float:
+        """Most frequent value (smallest on ties)."""
+        return float(self.values[np.argmax(self.counts)])
+
+
+class StreamingSummaryStats:
+    """
+    Out-of-core equivalent of ``comprehensive_summary_stats``.
+
+    Feed chunks with ``update`` (pandas Series/DataFrame chunks, e.g. from
+    ``pd.read_csv(chunksize=...)``, or numpy arrays and memmaps) and call
+    ``result`` to obtain the same dictionary. Count, missing, mean, std,
+    var, min, max, skewness and kurtosis are exact. Median, mode and the
+    quartiles are exact while the column has at most ``max_distinct``
+    distinct values; beyond that they come from a ``KLLSketch`` and carry
+    its error bound.
+    """
+
+    def __init__(self, column: Optional[str] = None, k: int = 200, seed: Optional[int] = None,
+                 max_distinct: int = 10_000):
+        self.column = column
+        self.missing = 0
+        self.moments = MomentAccumulator()
+        self.sketch = KLLSketch(k=k, seed=seed)
+        self.frequencies = FrequencyTable(max_distinct=max_distinct)
+
+    def update(self, chunk: Union[np.ndarray, pd.Series, pd.DataFrame]) -> 'StreamingSummaryStats':
+        """
+        Add a chunk of data.
+
+        Parameters:
+        -----------
+        chunk : array-like or pd.DataFrame
+            Chunk of values; DataFrames require ``column`` to be set
+
+        Returns:
+        --------
+        StreamingSummaryStats
+            self, to allow chaining
+        """
+        if isinstance(chunk, pd.DataFrame):
+            if self.column is None:
+                raise ValueError("column must be given when feeding DataFrame chunks")
+            chunk = chunk[self.column]
+        if isinstance(chunk, pd.Series):
+            values = chunk.to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = np.asarray(chunk, dtype=np.float64).ravel()
+
+        valid = ~np.isnan(values)
+        clean_values = values[valid]
+        self.missing += values.size - clean_values.size
+        self.moments.update(clean_values)
+        self.sketch.update(clean_values)
+        self.frequencies.update(clean_values)
+        return self
+
+    def merge(self, other: 'StreamingSummaryStats') -> 'StreamingSummaryStats':
+        """
+        Fold another accumulator (e.g. from a different shard) into this one.
+
+        Parameters:
+        -----------
+        other : StreamingSummaryStats
+            Accumulator built over a disjoint part of the data
+
+        Returns:
+        --------
+        StreamingSummaryStats
+            self, now describing the union of both parts
+        """
+        self.missing += other.missing
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+        self.frequencies.merge(other.frequencies)
+        return self
+
+    def result(self) -> dict:
+        """
+        Summary statistics for all data seen so far.
+
+        Returns:
+        --------
+        dict
+            Same keys as ``comprehensive_summary_stats``
+        """
+        moments = self.moments
+        if moments.count == 0:
+            return {'error': 'No valid data points'}
+
+        order_stats = self.frequencies if self.frequencies.active else self.sketch
+        q1, median, q3 = order_stats.quantile([0.25, 0.5, 0.75])
+        mean, std = moments.mean, moments.std
+
+        return {
+            'count': moments.count,
+            'missing': self.missing,
+            'mean': mean,
+            'median': median,
+            'mode': order_stats.mode(),
+            'std': std,
+            'var': moments.var,
+            'min': moments.min,
+            'max': moments.max,
+            'range': moments.max - moments.min,
+            'q1': q1,
+            'q3': q3,
+            'iqr': q3 - q1,
+            'skewness': moments.skewness,
+            'kurtosis': moments.kurtosis,
+            'cv': std / mean if mean != 0 else np.nan
+        }
+
+
+class WeightedMeanAccumulator:
+    """
+    Mergeable accumulator behind ``weighted_mean``.
+
+    Keeps the sum of weights and the sum of weighted values over the rows
+    where both are present, so shards can be combined exactly.
+    """
+
+    def __init__(self):
+        self.sum_weights = 0.0
+        self.sum_weighted_values = 0.0
+        self.count = 0
+
+    def update(self, values: Union[np.ndarray, pd.Series],
+               weights: Union[np.ndarray, pd.Series]) -> 'WeightedMeanAccumulator':
+        """
+        Add a chunk of values and their weights.
+
+        Parameters:
+        -----------
+        values : array-like
+            Chunk of values
+        weights : array-like
+            Weights corresponding to each value
+
+        Returns:
+        --------
+        WeightedMeanAccumulator
+            self, to allow chaining
+        """
+        values = np.asarray(values, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+        valid = ~(np.isnan(values) | np.isnan(weights))
+
+        self.sum_weights += weights[valid].sum()
+        self.sum_weighted_values += (values[valid] * weights[valid]).sum()
+        self.count += int(valid.sum())
+        return self
+
+    def merge(self, other: 'WeightedMeanAccumulator') -> 'WeightedMeanAccumulator':
+        """
+        Fold another accumulator into this one.
+
+        Parameters:
+        -----------
+        other : WeightedMeanAccumulator
+            Accumulator built over a disjoint part of the data
+
+        Returns:
+        --------
+        WeightedMeanAccumulator
+            self, now describing the union of both parts
+        """
+        self.sum_weights += other.sum_weights
+        self.sum_weighted_values += other.sum_weighted_values
+        self.count += other.count
+        return self
+
+    def result(self) -> float:
+        """Weighted mean of all data seen so far (NaN if empty)."""
+        if self.count == 0:
+            return np.nan
+        return self.sum_weighted_values / self.sum_weights
+
+
+class BinnedStatsAccumulator:
+    """
+    Mergeable per-bin statistics behind ``binning_analysis``.
+
+    For every target column and bin it keeps the count, mean, sum of
+    squared deviations, min and max as arrays (combined exactly with Chan's
+    parallel update), plus a ``KLLSketch`` per bin for the median. Bins must
+    be given as explicit edges so every shard uses the same bins.
+    """
+
+    STATS = ['count', 'mean', 'median', 'std', 'min', 'max']
+
+    def __init__(self,
+                 bin_column: str,
+                 target_columns: List[str],
+                 bins: List,
+                 labels: Optional[List] = None,
+                 k: int = 200,
+                 seed: Optional[int] = None):
+        if np.ndim(bins) == 0:
+            raise ValueError("BinnedStatsAccumulator requires explicit bin edges")
+
+        self.bin_column = bin_column
+        self.target_columns = list(target_columns)
+        self.edges = np.asarray(bins, dtype=np.float64)
+        self.breaks = np.asarray(bins)
+        self.labels = labels
+        n_bins = len(self.edges) - 1
+        n_targets = len(self.target_columns)
+
+        self.count = np.zeros((n_targets, n_bins), dtype=np.int64)
+        self.mean = np.zeros((n_targets, n_bins))
+        self.m2 = np.zeros((n_targets, n_bins))
+        self.min = np.full((n_targets, n_bins), np.inf)
+        self.max = np.full((n_targets, n_bins), -np.inf)
+        self.sketches = [[KLLSketch(k=k, seed=None if seed is None else seed + i * n_bins + b)
+                          for b in range(n_bins)]
+                         for i in range(n_targets)]
+
+    @property
+    def n_bins(self) -> int:
+        return len(self.edges) - 1
+
+    def update(self, chunk: pd.DataFrame) -> 'BinnedStatsAccumulator':
+        """
+        Add a chunk of rows.
+
+        Parameters:
+        -----------
+        chunk : pd.DataFrame
+            Chunk containing the bin column and all target columns
+
+        Returns:
+        --------
+        BinnedStatsAccumulator
+            self, to allow chaining
+        """
+        codes = bin_codes(chunk[self.bin_column].to_numpy(dtype=np.float64, na_value=np.nan),
+                          self.edges)
+
+        for i, col in enumerate(self.target_columns):
+            values = chunk[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            valid = (codes >= 0) & ~np.isnan(values)
+            group = codes[valid]
+            values = values[valid]
+
+            count = np.bincount(group, minlength=self.n_bins)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean = np.bincount(group, weights=values, minlength=self.n_bins) / count
+            deviations = values - mean[group]
+            m2 = np.bincount(group, weights=deviations * deviations, minlength=self.n_bins)
+
+            minimum = np.full(self.n_bins, np.inf)
+            maximum = np.full(self.n_bins, -np.inf)
+            np.minimum.at(minimum, group, values)
+            np.maximum.at(maximum, group, values)
+
+            self._combine(i, count, np.nan_to_num(mean), m2, minimum, maximum)
+
+            order = np.argsort(group, kind='stable')
+            boundaries = np.cumsum(count)[:-1]
+            for b, bin_values in enumerate(np.split(values[order], boundaries)):
+                self.sketches[i][b].update(bin_values)
+
+        return self
+
+    def _combine(self, i: int, count: np.ndarray, mean: np.ndarray, m2: np.ndarray,
+                 minimum: np.ndarray, maximum: np.ndarray):
+        """Combine per-bin moments of target ``i`` with another partition."""
+        n_a = self.count[i]
+        n = n_a + count
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean - self.mean[i]
+            ratio = np.where(n > 0, count / n, 0.0)
+
+        self.mean[i] = self.mean[i] + delta * ratio
+        self.m2[i] = self.m2[i] + m2 + delta * delta * n_a * ratio
+        self.count[i] = n
+        self.min[i] = np.minimum(self.min[i], minimum)
+        self.max[i] = np.maximum(self.max[i], maximum)
+
+    def merge(self, other: 'BinnedStatsAccumulator') -> 'BinnedStatsAccumulator':
+        """
+        Fold another accumulator with the same bins and targets into this one.
+
+        Parameters:
+        -----------
+        other : BinnedStatsAccumulator
+            Accumulator built over a disjoint part of the data
+
+        Returns:
+        --------
+        BinnedStatsAccumulator
+            self, now describing the union of both parts
+        """
+        if not np.array_equal(self.edges, other.edges) or self.target_columns != other.target_columns:
+            raise ValueError("Cannot merge accumulators with different bins or target columns")
+
+        for i in range(len(self.target_columns)):
+            self._combine(i, other.count[i], other.mean[i], other.m2[i], other.min[i], other.max[i])
+            for sketch, other_sketch in zip(self.sketches[i], other.sketches[i]):
+                sketch.merge(other_sketch)
+        return self
+
+    def result(self) -> pd.DataFrame:
+        """
+        Per-bin statistics for all data seen so far.
+
+        Returns:
+        --------
+        pd.DataFrame
+            Same layout as ``binning_analysis``: a ``bin`` column followed by
+            ``<column>_<stat>`` columns
+        """
+        if self.labels is not None:
+            categories = self.labels
+        else:
+            categories = pd.IntervalIndex.from_breaks(self.breaks, closed='left')
+        result = {'bin': pd.Categorical.from_codes(np.arange(self.n_bins), categories=categories,
+                                                   ordered=True)}
+
+        for i, col in enumerate(self.target_columns):
+            count = self.count[i]
+            empty = count == 0
+            with np.errstate(invalid='ignore', divide='ignore'):
+                std = np.sqrt(self.m2[i] / (count - 1))
+            std[count < 2] = np.nan
+
+            result[f'{col}_count'] = count
+            result[f'{col}_mean'] = np.where(empty, np.nan, self.mean[i])
+            result[f'{col}_median'] = [sketch.quantile(0.5) for sketch in self.sketches[i]]
+            result[f'{col}_std'] = std
+            result[f'{col}_min'] = np.where(empty, np.nan, self.min[i])
+            result[f'{col}_max'] = np.where(empty, np.nan, self.max[i])
+
+        return pd.DataFrame(result)
+
+
+class OnlineCovariance:
+    """
+    Mergeable accumulator of the covariance and correlation matrices of a stream.
+
+    Missing values are handled pairwise, as in ``DataFrame.corr``: for every
+    pair of columns it keeps the number of rows where both are present, the
+    means of both columns over those rows, their co-moment and the sums of
+    squared deviations, all as p x p arrays. A batch is reduced with a few
+    masked matrix products (O(batch * p^2)) and combined with the running
+    state using Chan's pairwise update, so the result does not depend on
+    how the stream was split.
+
+    Two ways of forgetting old data are supported:
+
+    - ``decay``: before each batch the accumulated state is scaled by the
+      factor ``decay`` in (0, 1], giving exponentially weighted estimates;
+      counts (and the sample sizes used for p-values) become effective
+      sample sizes
+    - ``window``: only the last ``window`` batches are kept, each as its own
+      reduced state (O(window * p^2) memory); they are re-combined when a
+      result is requested
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None,
+                 decay: Optional[float] = None,
+                 window: Optional[int] = None):
+        if decay is not None and not 0 < decay <= 1:
+            raise ValueError("decay must be in (0, 1]")
+        if decay is not None and window is not None:
+            raise ValueError("Use either decay or window, not both")
+        if window is not None and window < 1:
+            raise ValueError("window must be a positive number of batches")
+
+        self.columns = list(columns) if columns is not None else None
+        self.decay = decay
+        self.window = window
+        self.n_batches = 0
+        self._state = None
+        self._batches = deque(maxlen=window) if window is not None else None
+
+    def update(self, chunk: Union[np.ndarray, pd.DataFrame]) -> 'OnlineCovariance':
+        """
+        Add a batch of rows.
+
+        Parameters:
+        -----------
+        chunk : np.ndarray or pd.DataFrame
+            Batch of shape (rows, p); for DataFrames the numeric columns (or
+            ``columns``) are used
+
+        Returns:
+        --------
+        OnlineCovariance
+            self, to allow chaining
+        """
+        if isinstance(chunk, pd.DataFrame):
+            if self.columns is None:
+                self.columns = list(chunk.select_dtypes(include=[np.number]).columns)
+            values = chunk[self.columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        else:
+            values = np.asarray(chunk, dtype=np.float64)
+            if values.ndim == 1:
+                values = values[:, np.newaxis]
+            if self.columns is None:
+                self.columns = list(range(values.shape[1]))
+
+        state = self._reduce(values)
+        self.n_batches += 1
+        if self._batches is not None:
+            self._batches.append(state)
+        else:
+            if self.decay is not None and self._state is not None:
+                self._state = self._scaled(self._state, self.decay)
+            self._state = self._combine(self._state, state)
+        return self
+
+    def merge(self, other: 'OnlineCovariance') -> 'OnlineCovariance':
+        """
+        Fold another accumulator (e.g. from a different shard) into this one.
+
+        With ``window`` the most recent batches of both accumulators are
+        combined pairwise, so both shards should see the same batch
+        schedule (e.g. one batch per hour each).
+
+        Parameters:
+        -----------
+        other : OnlineCovariance
+            Accumulator over a disjoint part of the data with the same columns
+
+        Returns:
+        --------
+        OnlineCovariance
+            self, now describing the union of both parts
+        """
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+        elif list(other.columns) != list(self.columns):
+            raise ValueError("Cannot merge accumulators over different columns")
+
+        if self._batches is not None:
+            mine, theirs = list(self._batches), list(other._batches)
+            length = max(len(mine), len(theirs))
+            mine = [None] * (length - len(mine)) + mine
+            theirs = [None] * (length - len(theirs)) + theirs
+            self._batches.clear()
+            self._batches.extend(self._combine(a, b) for a, b in zip(mine, theirs))
+        else:
+            self._state = self._combine(self._state, other._state)
+        self.n_batches = max(self.n_batches, other.n_batches)
+        return self
+
+    @staticmethod
+    def _reduce(values: np.ndarray) -> tuple:
+        """Pairwise count, means, co-moments and sums of squares of one batch."""
+        valid = ~np.isnan(values)
+        weights = valid.astype(np.float64)
+        # Shift by the column means first so the products do not cancel
+        with np.errstate(invalid='ignore', divide='ignore'):
+            shift = np.nansum(values, axis=0) / weights.sum(axis=0)
+        centered = np.where(valid, values - np.nan_to_num(shift), 0.0)
+
+        count = weights.T @ weights
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, (centered.T @ weights) / count, 0.0)
+        comoment = centered.T @ centered - count * mean * mean.T
+        m2 = np.maximum((centered * centered).T @ weights - count * mean * mean, 0.0)
+        return count, mean + np.nan_to_num(shift)[:, np.newaxis], comoment, m2
+
+    @staticmethod
+    def _scaled(state: tuple, factor: float) -> tuple:
+        count, mean, comoment, m2 = state
+        return count * factor, mean, comoment * factor, m2 * factor
+
+    @staticmethod
+    def _combine(state_a: Optional[tuple], state_b: Optional[tuple]) -> Optional[tuple]:
+        """Chan's pairwise update of two reduced states."""
+        if state_a is None:
+            return state_b
+        if state_b is None:
+            return state_a
+        n_a, mean_a, comoment_a, m2_a = state_a
+        n_b, mean_b, comoment_b, m2_b = state_b
+
+        n = n_a + n_b
+        delta = mean_b - mean_a
+        with np.errstate(invalid='ignore', divide='ignore'):
+            weight = np.where(n > 0, n_a * n_b / n, 0.0)
+            mean = np.where(n > 0, mean_a + delta * n_b / n, 0.0)
+        comoment = comoment_a + comoment_b + delta * delta.T * weight
+        m2 = m2_a + m2_b + delta * delta * weight
+        return n, mean, comoment, m2
+
+    def _current(self) -> Optional[tuple]:
+        if self._batches is not None:
+            state = None
+            for batch_state in self._batches:
+                state = self._combine(state, batch_state)
+            return state
+        return self._state
+
+    def counts(self) -> pd.DataFrame:
+        """Number of rows (or effective rows with ``decay``) per pair of columns."""
+        state = self._current()
+        if state is None:
+            return pd.DataFrame()
+        return pd.DataFrame(state[0], index=self.columns, columns=self.columns)
+
+    def covariance(self) -> pd.DataFrame:
+        """Sample covariance matrix (ddof=1) over pairwise-complete rows."""
+        state = self._current()
+        if state is None:
+            return pd.DataFrame()
+        count, _, comoment, _ = state
+        with np.errstate(invalid='ignore', divide='ignore'):
+            covariance = np.where(count > 1, comoment / (count - 1), np.nan)
+        return pd.DataFrame(covariance, index=self.columns, columns=self.columns)
+
+    def correlation(self) -> pd.DataFrame:
+        """Pearson correlation matrix over pairwise-complete rows."""
+        state = self._current()
+        if state is None:
+            return pd.DataFrame()
+        count, _, comoment, m2 = state
+        with np.errstate(invalid='ignore', divide='ignore'):
+            corr = comoment / np.sqrt(m2 * m2.T)
+        corr = np.where(count > 1, np.clip(corr, -1.0, 1.0), np.nan)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def result(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Current correlation matrix and p-values, as returned by ``correlation_analysis``.
+
+        Returns:
+        --------
+        tuple
+            (correlation_matrix, p_values_matrix); the p-values use the
+            pairwise (effective) sample sizes
+        """
+        corr = self.correlation()
+        if corr.empty:
+            return corr, corr
+        p_values = correlation_p_values(corr.to_numpy(), self.counts().to_numpy(), method='pearson')
+        return corr, pd.DataFrame(p_values, index=corr.index, columns=corr.columns)
+
+
+def iter_chunks(source: Union[str, pd.DataFrame, Iterable[pd.DataFrame]],
+                columns: Optional[List[str]] = None,
+                chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+    """
+    Iterate over a data source in DataFrame chunks.
+
+    Parameters:
+    -----------
+    source : str, pd.DataFrame or iterable of DataFrames
+        CSV, Parquet, Feather or npy-directory path (only ``columns`` are
+        read, memory-mapped where possible; see ``data_io``), an in-memory
+        DataFrame (sliced without copying), or an existing iterator of
+        chunks (passed through)
+    columns : list, optional
+        Columns to read from files
+    chunksize : int, default=100_000
+        Rows per chunk
+
+    Yields:
+    -------
+    pd.DataFrame
+        Consecutive chunks of rows
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+    elif isinstance(source, str) and detect_format(source) == 'parquet':
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(source)
+        for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    elif isinstance(source, str) and detect_format(source) == 'feather':
+        # One record batch at a time, as zero-copy views of the memory-mapped file
+        yield from iter_feather_batches(source, columns=columns, chunksize=chunksize)
+    elif isinstance(source, str) and detect_format(source) == 'npy':
+        # Slices of memory-mapped .npy columns: no parsing and no copies
+        data = load_columns(source, columns=columns)
+        for start in range(0, len(data), chunksize):
+            yield data.iloc[start:start + chunksize]
+    elif isinstance(source, str):
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunksize)
+    else:
+        yield from source
+
+
+def streaming_binning_analysis(source: Union[str, Iterable[pd.DataFrame]],
+                               bin_column: str,
+                               target_columns: List[str],
+                               bins: List,
+                               labels: Optional[List] = None,
+                               chunksize: int = 100_000,
+                               on_partial: Optional[Callable[[pd.DataFrame], None]] = None,
+                               k: int = 200,
+                               seed: Optional[int] = None) -> pd.DataFrame:
+    """
+    Perform binning analysis over a file or stream of chunks with bounded memory.
+
+    Counts, means, standard deviations, minima and maxima are exact; medians
+    come from one ``KLLSketch`` per bin and target column (exact while a
+    bin has seen at most k values). Memory is O(chunksize + bins * k).
+
+    Parameters:
+    -----------
+    source : str or iterable of DataFrames
+        CSV/Parquet/Feather/npy path or an iterator of chunks (e.g. from
+        ``pd.read_csv(chunksize=...)``)
+    bin_column : str
+        Column name to create bins for
+    target_columns : list
+        Columns to calculate statistics for each bin
+    bins : list
+        Bin edges (left-closed, as in ``binning_analysis``); a number of bins
+        cannot be used because the data range is not known in advance
+    labels : list, optional
+        Labels for the bins
+    chunksize : int, default=100_000
+        Rows per chunk when reading from a file
+    on_partial : callable, optional
+        Called with the partial result DataFrame after every chunk
+    k : int, default=200
+        Size parameter of the median sketches
+    seed : int, optional
+        Seed for the sketches' compaction coin flips
+
+    Returns:
+    --------
+    pd.DataFrame
+        Binned analysis results, same layout as ``binning_analysis``
+    """
+    accumulator = BinnedStatsAccumulator(bin_column, target_columns, bins,
+                                         labels=labels, k=k, seed=seed)
+    columns = [bin_column] + [col for col in target_columns if col != bin_column]
+
+    for chunk in iter_chunks(source, columns=columns, chunksize=chunksize):
+        accumulator.update(chunk)
+        if on_partial is not None:
+            on_partial(accumulator.result())
+
+    return accumulator.result()
+
+
+def streaming_summary_stats(chunks: Iterable[Union[np.ndarray, pd.Series, pd.DataFrame]],
+                            column: Optional[str] = None,
+                            k: int = 200,
+                            seed: Optional[int] = None,
+                            max_distinct: int = 10_000) -> dict:
+    """
+    Calculate comprehensive summary statistics from an iterable of chunks.
+
+    Parameters:
+    -----------
+    chunks : iterable
+        Chunks of data, e.g. ``pd.read_csv(path, chunksize=100_000)`` or
+        slices of a numpy memmap
+    column : str, optional
+        Column to summarise when the chunks are DataFrames
+    k : int, default=200
+        Size parameter of the quantile sketch (larger is more accurate)
+    seed : int, optional
+        Seed for the sketch's compaction coin flips
+    max_distinct : int, default=10_000
+        Number of distinct values up to which order statistics are exact
+
+    Returns:
+    --------
+    dict
+        Same keys as ``comprehensive_summary_stats``
+    """
+    accumulator = StreamingSummaryStats(column=column, k=k, seed=seed,
+                                        max_distinct=max_distinct)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.result()
+
+
+def streaming_correlation_analysis(source: Union[str, Iterable[pd.DataFrame]],
+                                   columns: Optional[List[str]] = None,
+                                   chunksize: int = 100_000,
+                                   decay: Optional[float] = None,
+                                   window: Optional[int] = None,
+                                   on_partial: Optional[Callable[[pd.DataFrame, pd.DataFrame], None]] = None
+                                   ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Perform Pearson correlation analysis over a file or stream of batches.
+
+    Parameters:
+    -----------
+    source : str or iterable of DataFrames
+        CSV/Parquet/Feather/npy path or an iterator of batches
+    columns : list, optional
+        Columns to correlate (defaults to the numeric columns of the first batch)
+    chunksize : int, default=100_000
+        Rows per batch when reading from a file
+    decay : float, optional
+        Exponential forgetting factor per batch (see ``OnlineCovariance``)
+    window : int, optional
+        Number of most recent batches to keep (see ``OnlineCovariance``)
+    on_partial : callable, optional
+        Called with the current (correlation_matrix, p_values_matrix) after
+        every batch
+
+    Returns:
+    --------
+    tuple
+        (correlation_matrix, p_values_matrix), as from ``correlation_analysis``
+    """
+    accumulator = OnlineCovariance(columns=columns, decay=decay, window=window)
+    for chunk in iter_chunks(source, columns=columns, chunksize=chunksize):
+        accumulator.update(chunk)
+        if on_partial is not None:
+            on_partial(*accumulator.result())
+    return accumulator.result()
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    values = np.random.normal(50, 15, 100_000)
+    values[::97] = np.nan
+
+    chunks = (values[i:i + 10_000] for i in range(0, values.size, 10_000))
+    summary = streaming_summary_stats(chunks, seed=0)
+
+    print("Testing streaming summary statistics...")
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+
+    sample_data = pd.DataFrame(np.random.multivariate_normal([0, 0, 0], [[1, 0.6, 0.2], [0.6, 1, 0.4], [0.2, 0.4, 1]],
+                                                             size=50_000), columns=['x', 'y', 'z'])
+    corr, p_values = streaming_correlation_analysis(sample_data, chunksize=5_000, window=4)
+    print(corr)
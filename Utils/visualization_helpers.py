@@ -4,26 +4,87 @@ Author: Md Ayan Alam (GF202342645)
 Description: Utility functions for creating professional statistical visualizations
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.figure
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import os
+import sys
+
 import pandas as pd
 import numpy as np
-from typing import List, Optional, Tuple, Union, Any
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union, Any
 import warnings
 
+if __package__ in (None, ''):
+    # Run as a script (python Utils/visualization_helpers.py): resolve the relative
+    # imports below against the Utils package
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = 'Utils'
+
+from .plot_summaries import (DistributionSummary, _is_pair_table, cluster_order, correlation_tiles,
+                             grid_downsample)
+from .sorted_column import SortedColumn
+from .statistical_functions import linear_regression_bands
+from .stats_cache import cached_sorted_column, get_cache
+
+# matplotlib, seaborn and plotly take seconds to import, so they are loaded
+# on first use; annotations only need the Figure type
+if TYPE_CHECKING:
+    import matplotlib.figure
+
+
+# Colors of seaborn's "husl" palette, the default color cycle of these plots
+HUSL_PALETTE = ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4']
+
+_style_applied = False
+
+
+def _ensure_style():
+    """Apply the default style once, before the first figure is created."""
+    global _style_applied
+    if not _style_applied:
+        import matplotlib
+        import matplotlib.style
+        from cycler import cycler
+
+        matplotlib.style.use('default')
+        matplotlib.rcParams['axes.prop_cycle'] = cycler(color=HUSL_PALETTE)
+        setup_matplotlib_style()
+        _style_applied = True
+
+
+def _pyplot():
+    """Import pyplot on first use, with the default style applied."""
+    _ensure_style()
+    import matplotlib.pyplot as plt
+    return plt
+
 
-# Set default style
-plt.style.use('default')
-sns.set_palette("husl")
+def _seaborn():
+    import seaborn as sns
+    return sns
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the old module attributes (plt, sns, px, go, make_subplots) importable
+    if name == 'plt':
+        return _pyplot()
+    if name == 'sns':
+        return _seaborn()
+    if name == 'px':
+        import plotly.express as px
+        return px
+    if name == 'go':
+        import plotly.graph_objects as go
+        return go
+    if name == 'make_subplots':
+        from plotly.subplots import make_subplots
+        return make_subplots
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def setup_matplotlib_style():
     """Setup professional matplotlib styling."""
-    plt.rcParams.update({
+    import matplotlib
+
+    matplotlib.rcParams.update({
         'figure.figsize': (12, 8),
         'font.size': 11,
         'axes.titlesize': 14,
@@ -39,21 +100,23 @@ def setup_matplotlib_style():
     })
 
 
-def create_distribution_plot(data: Union[pd.Series, np.ndarray],
+def create_distribution_plot(data: Union[pd.Series, np.ndarray, SortedColumn, DistributionSummary],
                            title: str = "Distribution Plot",
                            bins: int = 30,
-                           show_stats: bool = True) -> matplotlib.figure.Figure:
+                           show_stats: bool = True) -> 'matplotlib.figure.Figure':
     """
     Create a comprehensive distribution plot with statistics.
 
     Parameters:
     -----------
-    data : array-like
-        Data to plot
+    data : array-like, SortedColumn or DistributionSummary
+        Data to plot; a ``DistributionSummary`` (see
+        ``summarize_distribution``) is drawn from its pre-aggregated counts
+        and box plot statistics
     title : str
         Plot title
     bins : int
-        Number of histogram bins
+        Number of histogram bins (ignored for a DistributionSummary)
     show_stats : bool
         Whether to show statistical lines
 
@@ -62,18 +125,46 @@ def create_distribution_plot(data: Union[pd.Series, np.ndarray],
     matplotlib.figure.Figure
         The created figure
     """
+    plt = _pyplot()
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    _draw_distribution(ax1, ax2, data, title, bins, show_stats)
+    plt.tight_layout()
+    return fig
+
 
-    # Remove NaN values
-    clean_data = pd.Series(data).dropna()
+def _draw_distribution(ax1, ax2, data: Union[pd.Series, np.ndarray, SortedColumn, DistributionSummary],
+                       title: str, bins: int, show_stats: bool):
+    """Draw the histogram and box plot of ``create_distribution_plot`` onto existing axes."""
+    # Summaries are drawn from their counts; sorted columns (given directly
+    # or from the cache) already know their quartiles and moments; otherwise
+    # work on the NaN-free data
+    summary, column = None, None
+    if isinstance(data, DistributionSummary):
+        summary = data
+    elif isinstance(data, SortedColumn) or get_cache() is not None:
+        column = cached_sorted_column(data)
+        clean_data = column.values
+    else:
+        clean_data = pd.Series(data).dropna()
 
     # Histogram
-    ax1.hist(clean_data, bins=bins, alpha=0.7, edgecolor='black', density=True)
+    if summary is not None:
+        ax1.hist(summary.edges[:-1], bins=summary.edges, weights=summary.counts,
+                 alpha=0.7, edgecolor='black', density=True)
+    else:
+        ax1.hist(clean_data, bins=bins, alpha=0.7, edgecolor='black', density=True)
 
     if show_stats:
-        mean_val = clean_data.mean()
-        median_val = clean_data.median()
-        std_val = clean_data.std()
+        if summary is not None:
+            mean_val, median_val, std_val = summary.mean, summary.median, summary.std
+        elif column is not None:
+            moments = column.moments()
+            mean_val, std_val = moments['mean'], moments['std']
+            median_val = column.median()
+        else:
+            mean_val = clean_data.mean()
+            median_val = clean_data.median()
+            std_val = clean_data.std()
 
         ax1.axvline(mean_val, color='red', linestyle='--',
                    label=f'Mean: {mean_val:.2f}')
@@ -90,46 +181,99 @@ def create_distribution_plot(data: Union[pd.Series, np.ndarray],
     ax1.set_ylabel('Density')
 
     # Box plot
-    ax2.boxplot(clean_data, vert=True)
+    if summary is not None:
+        ax2.bxp([summary.boxplot_stats()])
+    elif column is not None:
+        ax2.bxp([column.boxplot_stats()])
+    else:
+        ax2.boxplot(clean_data, vert=True)
     ax2.set_title(f'{title} - Box Plot')
     ax2.set_ylabel('Value')
     ax2.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    return fig
-
 
-def create_correlation_heatmap(corr_matrix: pd.DataFrame,
+def create_correlation_heatmap(corr_matrix: Union[pd.DataFrame, Iterable],
                               title: str = "Correlation Matrix",
-                              figsize: Tuple[int, int] = (10, 8)) -> matplotlib.figure.Figure:
+                              figsize: Tuple[int, int] = (10, 8),
+                              max_annotated_cells: int = 900,
+                              max_tiles: int = 512,
+                              cluster: bool = False,
+                              n_clusters: Optional[int] = None,
+                              columns: Optional[List[str]] = None,
+                              aggregate: str = 'mean') -> 'matplotlib.figure.Figure':
     """
     Create a professional correlation heatmap.
 
+    Matrices of up to ``max_annotated_cells`` cells are drawn with
+    annotated cells. Larger matrices, pair tables and block streams are
+    aggregated by ``correlation_tiles`` into at most ``max_tiles`` tiles per
+    side and drawn as a single ``imshow`` raster without annotations.
+
     Parameters:
     -----------
-    corr_matrix : pd.DataFrame
-        Correlation matrix
+    corr_matrix : pd.DataFrame or iterable
+        Correlation matrix, pair table from ``top_correlated_pairs`` or
+        blocks from ``correlation_blocks``
     title : str
         Plot title
     figsize : tuple
         Figure size
+    max_annotated_cells : int, default=900
+        Largest matrix drawn with annotated cells
+    max_tiles : int, default=512
+        Maximum number of tiles per side of the raster
+    cluster : bool, default=False
+        Reorder a dense matrix by hierarchical clustering (``cluster_order``)
+    n_clusters : int, optional
+        With ``cluster``, aggregate into one tile per cluster pair
+    columns : list, optional
+        Column order; required for blocks (see ``correlation_tiles``)
+    aggregate : str, default='mean'
+        How tiles combine correlations, 'mean' or 'max_abs'
 
     Returns:
     --------
     matplotlib.figure.Figure
         The created figure
     """
-    fig, ax = plt.subplots(figsize=figsize)
-
-    # Create heatmap
-    sns.heatmap(corr_matrix,
-                annot=True,
-                cmap='RdBu_r',
-                center=0,
-                square=True,
-                fmt='.2f',
-                cbar_kws={"shrink": .8},
-                ax=ax)
+    plt = _pyplot()
+    dense = isinstance(corr_matrix, pd.DataFrame) and not _is_pair_table(corr_matrix)
+
+    boundaries = None
+    if cluster:
+        if not dense:
+            raise ValueError("Clustering requires a dense correlation matrix")
+        columns, boundaries = cluster_order(corr_matrix, n_clusters=n_clusters)
+
+    if dense and corr_matrix.size <= max_annotated_cells and boundaries is None:
+        if columns is not None:
+            corr_matrix = corr_matrix.loc[columns, columns]
+        fig, ax = plt.subplots(figsize=figsize)
+
+        # Create heatmap
+        _seaborn().heatmap(corr_matrix,
+                           annot=True,
+                           cmap='RdBu_r',
+                           center=0,
+                           square=True,
+                           fmt='.2f',
+                           cbar_kws={"shrink": .8},
+                           ax=ax)
+    else:
+        tiles = correlation_tiles(corr_matrix, columns=columns, n_tiles=max_tiles,
+                                  boundaries=boundaries, aggregate=aggregate)
+        fig, ax = plt.subplots(figsize=figsize)
+        image = ax.imshow(tiles.to_numpy(), cmap='RdBu_r', vmin=-1, vmax=1, interpolation='nearest')
+        fig.colorbar(image, ax=ax, shrink=.8)
+
+        # Label tiles only while the labels stay legible
+        if len(tiles) <= 50:
+            ax.set_xticks(np.arange(len(tiles)), tiles.columns, rotation=90)
+            ax.set_yticks(np.arange(len(tiles)), tiles.index)
+        else:
+            ax.set_xticks([])
+            ax.set_yticks([])
+        ax.grid(False)
 
     ax.set_title(title, fontsize=14, pad=20)
     plt.tight_layout()
@@ -140,34 +284,77 @@ def create_scatter_with_regression(x: Union[pd.Series, np.ndarray],
                                   y: Union[pd.Series, np.ndarray],
                                   title: str = "Scatter Plot with Regression",
                                   xlabel: str = "X Variable",
-                                  ylabel: str = "Y Variable") -> matplotlib.figure.Figure:
+                                  ylabel: str = "Y Variable",
+                                  confidence_level: float = 0.95,
+                                  show_prediction: bool = True,
+                                  max_points: int = 50_000,
+                                  gridsize: int = 60) -> 'matplotlib.figure.Figure':
     """
     Create scatter plot with regression line and confidence interval.
 
+    The OLS line and its bands come from ``linear_regression_bands`` (one
+    fit, exact analytic intervals) rather than seaborn's bootstrap. Clouds
+    larger than ``max_points`` are drawn as a log-scaled hexbin density.
+    When the fit is undefined (fewer than 3 valid points or a constant x)
+    only the points are drawn, the correlation is shown as NaN and a
+    RuntimeWarning is issued.
+
     Parameters:
     -----------
     x, y : array-like
-        Variables to plot
+        Variables to plot; only rows where both are present are used
     title : str
         Plot title
     xlabel, ylabel : str
         Axis labels
+    confidence_level : float, default=0.95
+        Coverage of the confidence and prediction bands
+    show_prediction : bool, default=True
+        Whether to draw the prediction band as well as the confidence band
+    max_points : int, default=50_000
+        Largest number of points drawn individually
+    gridsize : int, default=60
+        Number of hexagons across the x range of the density layer
 
     Returns:
     --------
     matplotlib.figure.Figure
         The created figure
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(10, 7))
 
-    # Create scatter plot with regression line
-    sns.scatterplot(x=x, y=y, alpha=0.6, ax=ax)
-    sns.regplot(x=x, y=y, scatter=False, color='red', ax=ax)
-
-    # Calculate correlation
-    corr = np.corrcoef(pd.Series(x).dropna(), pd.Series(y).dropna())[0, 1]
-
-    ax.set_title(f'{title}\nCorrelation: {corr:.3f}')
+    x_values = pd.Series(x).to_numpy(dtype=np.float64, na_value=np.nan)
+    y_values = pd.Series(y).to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~(np.isnan(x_values) | np.isnan(y_values))
+    x_values, y_values = x_values[valid], y_values[valid]
+
+    if x_values.size > max_points:
+        density = ax.hexbin(x_values, y_values, gridsize=gridsize, mincnt=1, bins='log', cmap='Blues')
+        fig.colorbar(density, ax=ax, label='Count')
+    else:
+        _seaborn().scatterplot(x=x_values, y=y_values, alpha=0.6, ax=ax)
+
+    # Regression line with analytic bands; an undefined fit still leaves the scatter
+    try:
+        regression = linear_regression_bands(x_values, y_values, confidence_level=confidence_level)
+    except ValueError as error:
+        warnings.warn(f"Regression line skipped: {error}", RuntimeWarning, stacklevel=2)
+        correlation = np.nan
+    else:
+        correlation = regression['correlation']
+        level = f'{confidence_level:.0%}'
+        if show_prediction:
+            ax.fill_between(regression['x'], regression['pi_lower'], regression['pi_upper'],
+                            color='red', alpha=0.08, label=f'{level} prediction interval')
+        ax.fill_between(regression['x'], regression['ci_lower'], regression['ci_upper'],
+                        color='red', alpha=0.2, label=f'{level} confidence interval')
+        ax.plot(regression['x'], regression['fit'], color='red',
+                label=f"y = {regression['slope']:.3g}x {'-' if regression['intercept'] < 0 else '+'} "
+                      f"{abs(regression['intercept']):.3g}")
+        ax.legend()
+
+    ax.set_title(f"{title}\nCorrelation: {correlation:.3f}")
     ax.set_xlabel(xlabel)
     ax.set_ylabel(ylabel)
 
@@ -178,7 +365,7 @@ def create_scatter_with_regression(x: Union[pd.Series, np.ndarray],
 def create_grouped_bar_plot(data: pd.DataFrame,
                            x_col: str,
                            y_cols: List[str],
-                           title: str = "Grouped Bar Plot") -> matplotlib.figure.Figure:
+                           title: str = "Grouped Bar Plot") -> 'matplotlib.figure.Figure':
     """
     Create a grouped bar plot for multiple variables.
 
@@ -198,6 +385,7 @@ def create_grouped_bar_plot(data: pd.DataFrame,
     matplotlib.figure.Figure
         The created figure
     """
+    plt = _pyplot()
     fig, ax = plt.subplots(figsize=(12, 7))
 
     x = np.arange(len(data[x_col]))
@@ -223,10 +411,21 @@ def create_interactive_scatter(data: pd.DataFrame,
                               x_col: str,
                               y_col: str,
                               color_col: Optional[str] = None,
-                              title: str = "Interactive Scatter Plot"):
+                              title: str = "Interactive Scatter Plot",
+                              hover_cols: Optional[List[str]] = None,
+                              max_points: int = 100_000,
+                              grid_size: int = 256,
+                              seed: Optional[int] = None):
     """
     Create an interactive scatter plot using Plotly.
 
+    Frames with more than ``max_points`` rows are drawn in a scalable mode:
+    WebGL (``Scattergl``) markers, hover data limited to ``hover_cols``, and
+    a density-preserving sample of the rows from ``grid_downsample``
+    (stratified by ``color_col`` when it is categorical). Only the plotted
+    columns are handed to plotly, each as a numpy array, so numeric columns
+    are serialized as binary typed arrays.
+
     Parameters:
     -----------
     data : pd.DataFrame
@@ -237,18 +436,46 @@ def create_interactive_scatter(data: pd.DataFrame,
         Column name for color coding
     title : str
         Plot title
+    hover_cols : list, optional
+        Extra columns shown on hover (defaults to all columns below
+        ``max_points`` rows and none above)
+    max_points : int, default=100_000
+        Largest number of rows drawn without downsampling
+    grid_size : int, default=256
+        Grid cells per axis used for downsampling
+    seed : int, optional
+        Seed for the downsampling
 
     Returns:
     --------
     plotly.graph_objects.Figure
         Interactive plotly figure
     """
-    fig = px.scatter(data,
+    import plotly.express as px
+
+    large = len(data) > max_points
+    if hover_cols is None:
+        hover_cols = [] if large else data.columns.tolist()
+    used_cols = list(dict.fromkeys([x_col, y_col] + ([color_col] if color_col else []) + list(hover_cols)))
+    # Plain numpy arrays per column: plotly encodes numeric arrays as binary typed arrays
+    plot_data = {col: data[col].to_numpy() for col in used_cols}
+
+    if large:
+        strata = None
+        if color_col is not None and not pd.api.types.is_numeric_dtype(data[color_col]):
+            strata = pd.factorize(plot_data[color_col])[0]
+        keep = grid_downsample(plot_data[x_col], plot_data[y_col], max_points,
+                               grid_size=grid_size, strata=strata, seed=seed)
+        plot_data = {col: values[keep] for col, values in plot_data.items()}
+        title = f"{title} ({keep.size:,} of {len(data):,} points)"
+
+    fig = px.scatter(plot_data,
                     x=x_col,
                     y=y_col,
                     color=color_col,
                     title=title,
-                    hover_data=data.columns.tolist())
+                    hover_data=hover_cols,
+                    render_mode='webgl' if large else 'auto')
 
     fig.update_layout(
         title_font_size=16,
@@ -260,21 +487,24 @@ def create_interactive_scatter(data: pd.DataFrame,
     return fig
 
 
-def create_subplots_grid(data: pd.DataFrame,
+def create_subplots_grid(data: Union[pd.DataFrame, Dict[str, DistributionSummary]],
                         columns: List[str],
                         plot_type: str = 'hist',
-                        title: str = "Multiple Variables Analysis") -> matplotlib.figure.Figure:
+                        title: str = "Multiple Variables Analysis") -> 'matplotlib.figure.Figure':
     """
     Create a grid of subplots for multiple variables.
 
     Parameters:
     -----------
-    data : pd.DataFrame
-        Input data
+    data : pd.DataFrame or dict
+        Input data, or a mapping of column name to ``DistributionSummary``
+        (see ``summarize_distribution``) to draw from pre-aggregated counts
+        and box plot statistics
     columns : list
         Columns to plot
     plot_type : str
-        Type of plot ('hist', 'box', 'violin')
+        Type of plot ('hist', 'box', 'violin'; summaries support 'hist'
+        and 'box')
     title : str
         Overall title
 
@@ -286,51 +516,56 @@ def create_subplots_grid(data: pd.DataFrame,
     n_cols = min(3, len(columns))
     n_rows = (len(columns) + n_cols - 1) // n_cols
 
-    fig, axes = plt.subplots(n_rows, n_cols, figsize=(5*n_cols, 4*n_rows))
-
-    if n_rows == 1:
-        axes = axes.reshape(1, -1) if n_cols > 1 else [axes]
-    elif n_cols == 1:
-        axes = axes.reshape(-1, 1)
+    plt = _pyplot()
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(5*n_cols, 4*n_rows), squeeze=False)
 
     for i, col in enumerate(columns):
-        row = i // n_cols
-        col_idx = i % n_cols
-        ax = axes[row][col_idx] if n_rows > 1 else axes[col_idx]
-
-        clean_data = data[col].dropna()
-
-        if plot_type == 'hist':
-            ax.hist(clean_data, bins=20, alpha=0.7, edgecolor='black')
-        elif plot_type == 'box':
-            ax.boxplot(clean_data)
-        elif plot_type == 'violin':
-            parts = ax.violinplot([clean_data])
-
-        ax.set_title(f'{col}')
-        ax.grid(True, alpha=0.3)
+        values = data[col]
+        if not isinstance(values, DistributionSummary):
+            values = values.dropna()
+        _draw_column(axes[i // n_cols][i % n_cols], values, plot_type, f'{col}')
 
     # Hide empty subplots
     for i in range(len(columns), n_rows * n_cols):
-        row = i // n_cols
-        col_idx = i % n_cols
-        if n_rows > 1:
-            axes[row][col_idx].set_visible(False)
-        else:
-            axes[col_idx].set_visible(False)
+        axes[i // n_cols][i % n_cols].set_visible(False)
 
     fig.suptitle(title, fontsize=16)
     plt.tight_layout()
     return fig
 
 
-def save_publication_figure(fig: matplotlib.figure.Figure,
+def _draw_column(ax, clean_data: Union[pd.Series, np.ndarray, DistributionSummary], plot_type: str, title: str):
+    """Draw one panel of ``create_subplots_grid`` onto an existing axes."""
+    if isinstance(clean_data, DistributionSummary):
+        if plot_type == 'hist':
+            ax.hist(clean_data.edges[:-1], bins=clean_data.edges, weights=clean_data.counts,
+                    alpha=0.7, edgecolor='black')
+        elif plot_type == 'box':
+            ax.bxp([clean_data.boxplot_stats()])
+        else:
+            raise ValueError(f"Plot type '{plot_type}' needs the raw data, not a DistributionSummary")
+    elif plot_type == 'hist':
+        ax.hist(clean_data, bins=20, alpha=0.7, edgecolor='black')
+    elif plot_type == 'box':
+        ax.boxplot(clean_data)
+    elif plot_type == 'violin':
+        ax.violinplot([clean_data])
+
+    ax.set_title(title)
+    ax.grid(True, alpha=0.3)
+
+
+def save_publication_figure(fig: 'matplotlib.figure.Figure',
                            filename: str,
                            dpi: int = 300,
-                           formats: List[str] = ['png', 'pdf']):
+                           formats: List[str] = ['png', 'pdf'],
+                           n_threads: Optional[int] = None):
     """
     Save figure in publication-quality formats.
 
+    The tight layout is computed once for all formats and raster formats
+    share a single render (see ``export_figure``).
+
     Parameters:
     -----------
     fig : matplotlib.figure.Figure
@@ -341,18 +576,13 @@ def save_publication_figure(fig: matplotlib.figure.Figure,
         Resolution for raster formats
     formats : list
         List of file formats to save
+    n_threads : int, optional
+        Threads for encoding and writing the files
     """
-    for fmt in formats:
-        fig.savefig(f"{filename}.{fmt}",
-                   dpi=dpi,
-                   bbox_inches='tight',
-                   facecolor='white',
-                   edgecolor='none')
-    print(f"Figure saved as: {', '.join([f'{filename}.{fmt}' for fmt in formats])}")
-
+    from .figure_export import export_figure
 
-# Initialize styling when module is imported
-setup_matplotlib_style()
+    paths = export_figure(fig, filename, formats=formats, dpi=dpi, n_threads=n_threads)
+    print(f"Figure saved as: {', '.join(paths)}")
 
 
 # Example usage
@@ -369,6 +599,7 @@ if __name__ == "__main__":
     })
 
     print("Testing visualization functions...")
+    plt = _pyplot()
 
     # Test distribution plot
     fig1 = create_distribution_plot(test_data['var1'], "Test Distribution")
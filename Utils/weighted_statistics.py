@@ -0,0 +1,342 @@
+"""
+Weighted Statistics Module
+Author: Md Ayan Alam (GF202342645)
+Description: NaN-aware weighted statistics on NumPy arrays, single and grouped
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Union
+
+
+ArrayLike = Union[np.ndarray, pd.Series]
+
+
+def _as_float_array(values: ArrayLike) -> np.ndarray:
+    """View the input as a float64 array, copying only when a conversion is needed."""
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.asarray(values, dtype=np.float64)
+
+
+def _clean_pairs(values: ArrayLike, weights: ArrayLike):
+    """Return values and weights with NaN pairs removed (no copy when nothing is missing)."""
+    values = _as_float_array(values)
+    weights = _as_float_array(weights)
+    valid = ~(np.isnan(values) | np.isnan(weights))
+    if valid.all():
+        return values, weights
+    return values[valid], weights[valid]
+
+
+def weighted_mean(values: ArrayLike, weights: ArrayLike) -> float:
+    """
+    Calculate the weighted mean, ignoring pairs where either value is NaN.
+
+    Parameters:
+    -----------
+    values : array-like
+        Values to calculate weighted mean for
+    weights : array-like
+        Weights corresponding to each value
+
+    Returns:
+    --------
+    float
+        Weighted mean of the values (NaN if no valid pairs)
+    """
+    values, weights = _clean_pairs(values, weights)
+    if values.size == 0:
+        return np.nan
+    return np.dot(values, weights) / weights.sum()
+
+
+def weighted_var(values: ArrayLike,
+                 weights: ArrayLike,
+                 ddof: int = 0,
+                 weight_type: str = 'frequency') -> float:
+    """
+    Calculate the weighted variance, ignoring pairs where either value is NaN.
+
+    Parameters:
+    -----------
+    values : array-like
+        Values to calculate weighted variance for
+    weights : array-like
+        Weights corresponding to each value
+    ddof : int, default=0
+        0 for the population variance, 1 for the unbiased estimate
+    weight_type : str, default='frequency'
+        How weights are interpreted when ddof=1: 'frequency' (counts,
+        divisor sum(w) - 1) or 'reliability' (divisor
+        sum(w) - sum(w^2) / sum(w))
+
+    Returns:
+    --------
+    float
+        Weighted variance of the values
+    """
+    values, weights = _clean_pairs(values, weights)
+    if values.size == 0:
+        return np.nan
+
+    sum_weights = weights.sum()
+    mean = np.dot(values, weights) / sum_weights
+    deviations = values - mean
+    sum_squares = np.dot(weights, deviations * deviations)
+
+    return sum_squares / _variance_divisor(sum_weights, np.dot(weights, weights), ddof, weight_type)
+
+
+def _variance_divisor(sum_weights, sum_squared_weights, ddof: int, weight_type: str):
+    """Divisor of the weighted sum of squares for the given ddof and weight type."""
+    if ddof == 0:
+        return sum_weights
+    if ddof != 1:
+        raise ValueError("ddof must be 0 or 1")
+    if weight_type == 'frequency':
+        divisor = sum_weights - 1
+    elif weight_type == 'reliability':
+        with np.errstate(invalid='ignore', divide='ignore'):
+            divisor = sum_weights - sum_squared_weights / sum_weights
+    else:
+        raise ValueError(f"Unknown weight_type: {weight_type}")
+    divisor = np.where(np.asarray(divisor) > 0, divisor, np.nan)
+    return divisor if divisor.ndim else float(divisor)
+
+
+def weighted_std(values: ArrayLike,
+                 weights: ArrayLike,
+                 ddof: int = 0,
+                 weight_type: str = 'frequency') -> float:
+    """
+    Calculate the weighted standard deviation (square root of ``weighted_var``).
+
+    Parameters:
+    -----------
+    values : array-like
+        Values to calculate weighted standard deviation for
+    weights : array-like
+        Weights corresponding to each value
+    ddof : int, default=0
+        0 for the population estimate, 1 for the sample estimate
+    weight_type : str, default='frequency'
+        'frequency' or 'reliability' (see ``weighted_var``)
+
+    Returns:
+    --------
+    float
+        Weighted standard deviation of the values
+    """
+    return np.sqrt(weighted_var(values, weights, ddof=ddof, weight_type=weight_type))
+
+
+def weighted_quantile(values: ArrayLike,
+                      weights: ArrayLike,
+                      q: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Calculate weighted quantiles, ignoring pairs where either value is NaN.
+
+    Each sorted value is placed at the midpoint of its cumulative weight,
+    p_k = (S_k - w_k / 2) / S_n, and quantiles are linearly interpolated
+    between these positions (values beyond the outermost positions are
+    clamped). With equal weights this is the Hazen plotting-position
+    quantile.
+
+    Parameters:
+    -----------
+    values : array-like
+        Values to calculate quantiles for
+    weights : array-like
+        Non-negative weights corresponding to each value
+    q : float or array-like
+        Quantile(s) in [0, 1]
+
+    Returns:
+    --------
+    float or np.ndarray
+        Weighted quantile(s)
+    """
+    values, weights = _clean_pairs(values, weights)
+    positive = weights > 0
+    values, weights = values[positive], weights[positive]
+    if values.size == 0:
+        return np.full(np.shape(q), np.nan) if np.ndim(q) else np.nan
+
+    order = np.argsort(values)
+    values, weights = values[order], weights[order]
+    cumulative = np.cumsum(weights)
+    positions = (cumulative - weights / 2) / cumulative[-1]
+
+    return np.interp(q, positions, values)
+
+
+def weighted_median(values: ArrayLike, weights: ArrayLike) -> float:
+    """
+    Calculate the weighted median (``weighted_quantile`` at 0.5).
+
+    Parameters:
+    -----------
+    values : array-like
+        Values to calculate the median for
+    weights : array-like
+        Non-negative weights corresponding to each value
+
+    Returns:
+    --------
+    float
+        Weighted median of the values
+    """
+    return weighted_quantile(values, weights, 0.5)
+
+
+def _clean_grouped(values: ArrayLike, weights: ArrayLike, group_codes: ArrayLike,
+                   n_groups: Optional[int]):
+    """Drop NaN pairs and negative codes; infer the number of groups."""
+    values = _as_float_array(values)
+    weights = _as_float_array(weights)
+    group_codes = np.asarray(group_codes)
+    valid = ~(np.isnan(values) | np.isnan(weights)) & (group_codes >= 0)
+    if not valid.all():
+        values, weights, group_codes = values[valid], weights[valid], group_codes[valid]
+    if n_groups is None:
+        n_groups = int(group_codes.max()) + 1 if group_codes.size else 0
+    return values, weights, group_codes.astype(np.intp, copy=False), n_groups
+
+
+def grouped_weighted_stats(values: ArrayLike,
+                           weights: ArrayLike,
+                           group_codes: ArrayLike,
+                           n_groups: Optional[int] = None,
+                           ddof: int = 0,
+                           weight_type: str = 'frequency') -> pd.DataFrame:
+    """
+    Weighted count, mean, variance and standard deviation for every group at once.
+
+    All groups are reduced together with ``np.bincount`` over the integer
+    group codes (sums of weights, weighted values and weighted squares of
+    values shifted by the overall weighted mean for numerical stability).
+
+    Parameters:
+    -----------
+    values : array-like
+        Values
+    weights : array-like
+        Weights corresponding to each value
+    group_codes : array-like of int
+        Group index per value in [0, n_groups); negative codes are ignored
+        (e.g. the codes of a pandas Categorical)
+    n_groups : int, optional
+        Number of groups (defaults to max(group_codes) + 1)
+    ddof : int, default=0
+        0 for population variances, 1 for sample variances
+    weight_type : str, default='frequency'
+        'frequency' or 'reliability' (see ``weighted_var``)
+
+    Returns:
+    --------
+    pd.DataFrame
+        One row per group with columns count, sum_weights, mean, var, std
+    """
+    values, weights, group_codes, n_groups = _clean_grouped(values, weights, group_codes, n_groups)
+
+    shift = np.dot(values, weights) / weights.sum() if values.size else 0.0
+    shifted = values - shift
+
+    count = np.bincount(group_codes, minlength=n_groups)
+    sum_weights = np.bincount(group_codes, weights=weights, minlength=n_groups)
+    sum_weighted = np.bincount(group_codes, weights=weights * shifted, minlength=n_groups)
+    sum_squared_weights = np.bincount(group_codes, weights=weights * weights, minlength=n_groups)
+    sum_weighted_squares = np.bincount(group_codes, weights=weights * shifted * shifted,
+                                       minlength=n_groups)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = sum_weighted / sum_weights
+        sum_squares = np.maximum(sum_weighted_squares - sum_weighted * mean, 0.0)
+        var = sum_squares / _variance_divisor(sum_weights, sum_squared_weights, ddof, weight_type)
+    var[count == 0] = np.nan
+
+    return pd.DataFrame({
+        'count': count,
+        'sum_weights': sum_weights,
+        'mean': mean + shift,
+        'var': var,
+        'std': np.sqrt(var)
+    })
+
+
+def grouped_weighted_quantile(values: ArrayLike,
+                              weights: ArrayLike,
+                              group_codes: ArrayLike,
+                              q: float,
+                              n_groups: Optional[int] = None) -> np.ndarray:
+    """
+    Weighted quantile of every group at once.
+
+    Uses one ``np.lexsort`` by (group, value) and a single interpolation over
+    the concatenated groups, with the same plotting positions as
+    ``weighted_quantile``.
+
+    Parameters:
+    -----------
+    values : array-like
+        Values
+    weights : array-like
+        Non-negative weights corresponding to each value
+    group_codes : array-like of int
+        Group index per value in [0, n_groups); negative codes are ignored
+    q : float
+        Quantile in [0, 1]
+    n_groups : int, optional
+        Number of groups (defaults to max(group_codes) + 1)
+
+    Returns:
+    --------
+    np.ndarray
+        Quantile per group (NaN for empty groups)
+    """
+    values, weights, group_codes, n_groups = _clean_grouped(values, weights, group_codes, n_groups)
+    positive = weights > 0
+    values, weights, group_codes = values[positive], weights[positive], group_codes[positive]
+
+    result = np.full(n_groups, np.nan)
+    if values.size == 0:
+        return result
+
+    order = np.lexsort((values, group_codes))
+    values, weights, group_codes = values[order], weights[order], group_codes[order]
+
+    counts = np.bincount(group_codes, minlength=n_groups)
+    stops = np.cumsum(counts)
+    starts = stops - counts
+    cumulative = np.cumsum(weights)
+    offsets = np.concatenate([[0.0], cumulative])[starts]
+    totals = np.bincount(group_codes, weights=weights, minlength=n_groups)
+
+    within = cumulative - offsets[group_codes]
+    positions = (within - weights / 2) / totals[group_codes]
+
+    # Offset each group's positions by its code so all groups interpolate in one call
+    non_empty = np.flatnonzero(counts)
+    lowest = positions[starts[non_empty]]
+    highest = positions[stops[non_empty] - 1]
+    targets = non_empty + np.clip(q, lowest, highest)
+    result[non_empty] = np.interp(targets, group_codes + positions, values)
+
+    return result
+
+
+# Example usage
+if __name__ == "__main__":
+    np.random.seed(42)
+    income = np.random.normal(60000, 15000, 1000)
+    age = np.random.randint(18, 65, 1000).astype(float)
+    income[::50] = np.nan
+
+    print("Testing weighted statistics...")
+    print(f"Age-weighted mean income: {weighted_mean(income, age):.2f}")
+    print(f"Age-weighted median income: {weighted_median(income, age):.2f}")
+    print(f"Age-weighted std of income: {weighted_std(income, age, ddof=1):.2f}")
+
+    age_group = np.digitize(age, [25, 35, 45])
+    print(grouped_weighted_stats(income, age, age_group))